@@ -1,3 +1,5 @@
+__version__ = '0.0.1'
+
 from .general.generalsection import GeneralSection
 from .general.materialsection import MaterialSection
 from .general.compositesection import CompositeSection
@@ -11,3 +11,6 @@ sfrm = '.1f' # Stress format
 efrm = '.0f' # Elastic Modulus formaty
 
 msmode = False # Output Margins of Safety
+
+cachesize = 4096 # Maximum number of cached section property records (0 disables)
+meshcachesize = 64 # Maximum number of cached section meshes
@@ -1,8 +1,10 @@
+from math import pi
 from py2md.classes import MDTable
 from ..general.generalsection import GeneralSection
 from .. import config
 
 class CircleSection(GeneralSection):
+    closedform = True
     d = None
     def __init__(self, d: float, label: str=None):
         self.d = d
@@ -11,6 +13,11 @@ class CircleSection(GeneralSection):
         z = [radius, radius, -radius, -radius]
         r = [radius, radius, radius, radius]
         super().__init__(y, z, r, label=label)
+    def calculate_moments(self):
+        if self.transformed:
+            super().calculate_moments()
+        else:
+            self.set_moments(*circle_moments(self.d))
     def __repr__(self):
         if self.label is None:
             outstr = '<Circle-Section>'
@@ -26,3 +33,8 @@ class CircleSection(GeneralSection):
         return mdstr
     def _repr_markdown_(self):
         return self.__str__()
+
+def circle_moments(d: float):
+    A = pi*d**2/4
+    I = pi*d**4/64
+    return A, 0.0, 0.0, I, I, 0.0
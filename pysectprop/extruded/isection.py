@@ -21,19 +21,24 @@ class ISection(GeneralSection):
         self.tf2 = tf2
         self.r1 = r1
         self.r2 = r2
-        y = [0.0, self.wf1/2, self.wf1/2,
-             self.tw/2, self.tw/2, self.wf2/2,
-             self.wf2/2, 0.0, -self.wf2/2, -self.wf2/2,
-             -self.tw/2, -self.tw/2, -self.wf1/2,
-             -self.wf1/2, 0.0]
-        z = [0.0, 0.0, self.tf1, self.tf1,
-             self.hw-self.tf2, self.hw-self.tf2, self.hw,
-             self.hw, self.hw, self.hw-self.tf2, self.hw-self.tf2,
-             self.tf1, self.tf1, 0.0, 0.0]
-        r = [0.0, 0.0, 0.0, self.r1, self.r2,
-             0.0, 0.0, 0.0, 0.0, 0.0,
-             self.r2, self.r1, 0.0, 0.0, 0.0]
+        y, z, r = self.outline(hw, tw, wf1, tf1, wf2, tf2, r1, r2)
         super().__init__(y, z, r, label=label)
+    @staticmethod
+    def outline(hw: float, tw: float, wf1: float, tf1: float,
+                wf2: float, tf2: float, r1: float=0.0, r2: float=0.0):
+        y = [0.0, wf1/2, wf1/2,
+             tw/2, tw/2, wf2/2,
+             wf2/2, 0.0, -wf2/2, -wf2/2,
+             -tw/2, -tw/2, -wf1/2,
+             -wf1/2, 0.0]
+        z = [0.0, 0.0, tf1, tf1,
+             hw-tf2, hw-tf2, hw,
+             hw, hw, hw-tf2, hw-tf2,
+             tf1, tf1, 0.0, 0.0]
+        r = [0.0, 0.0, 0.0, r1, r2,
+             0.0, 0.0, 0.0, 0.0, 0.0,
+             r2, r1, 0.0, 0.0, 0.0]
+        return y, z, r
     def __repr__(self):
         if self.label is None:
             outstr = '<I-Section>'
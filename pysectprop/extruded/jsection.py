@@ -24,31 +24,39 @@ class JSection(GeneralSection):
         self.hl = hl
         self.tl = tl
 
+        y, z, r = self.outline(hw, tw, wuf, tuf, wlf, tlf, hl, tl)
+
+        super().__init__(y, z, r, label=label)
+
+    @staticmethod
+    def outline(hw: float, tw: float, wuf: float, tuf: float,
+                wlf: float, tlf: float, hl: float=0.0, tl: float=0.0):
+
         pt1y = 0.0
-        pt2y = self.wuf
-        pt3y = self.wuf
-        pt4y = pt3y - self.wuf/2 + self.tw/2
+        pt2y = wuf
+        pt3y = wuf
+        pt4y = pt3y - wuf/2 + tw/2
         pt5y = pt4y
-        pt6y = pt5y -self.tw - self.wlf
+        pt6y = pt5y -tw - wlf
         pt7y = pt6y
-        pt8y = pt7y + self.tl
+        pt8y = pt7y + tl
         pt9y = pt8y
-        pt10y = pt9y + self.wlf - self.tl
+        pt10y = pt9y + wlf - tl
         pt11y = pt10y
         pt12y = 0.0
         pt13y = pt1y
 
-        pt1z = self.hw + self.tuf
+        pt1z = hw + tuf
         pt2z = pt1z
-        pt3z = self.hw
+        pt3z = hw
         pt4z = pt3z
         pt5z = 0
         pt6z = pt5z
-        pt7z = pt6z + self.tlf + self.hl
+        pt7z = pt6z + tlf + hl
         pt8z = pt7z
-        pt9z = self.tlf
+        pt9z = tlf
         pt10z = pt9z
-        pt11z = self.hw
+        pt11z = hw
         pt12z = pt11z
         pt13z = pt1z
 
@@ -66,7 +74,7 @@ class JSection(GeneralSection):
              0.0, 0.0, 0.0, 0.0,
              0.0]
 
-        super().__init__(y, z, r, label=label)
+        return y, z, r
 
     def __repr__(self):
         if self.label is None:
@@ -14,10 +14,14 @@ class LSection(GeneralSection):
         self.wf = wf
         self.tf = tf
         self.rc = rc
-        y = [0.0, self.wf, self.wf, self.tw, self.tw, 0.0]
-        z = [0.0, 0.0, self.tf, self.tf, self.hw, self.hw]
-        r = [0.0, 0.0, 0.0, self.rc, 0.0, 0.0]
+        y, z, r = self.outline(hw, tw, wf, tf, rc)
         super().__init__(y, z, r, label=label)
+    @staticmethod
+    def outline(hw: float, tw: float, wf: float, tf: float, rc: float=0.0):
+        y = [0.0, wf, wf, tw, tw, 0.0]
+        z = [0.0, 0.0, tf, tf, hw, hw]
+        r = [0.0, 0.0, 0.0, rc, 0.0, 0.0]
+        return y, z, r
     def __repr__(self):
         if self.label is None:
             outstr = '<L-Section>'
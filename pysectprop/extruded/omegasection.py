@@ -21,17 +21,22 @@ class OmegaSection(GeneralSection):
         self.tl = tl
         self.rf = rf
         self.rl = rl
-        y = [0.0, self.wf/2, self.wf/2,
-             self.wf/2-self.tw+self.wl, self.wf/2-self.tw+self.wl,
-             self.wf/2-self.tw, self.wf/2-self.tw, 0.0, self.tw-self.wf/2, self.tw-self.wf/2,
-             self.tw-self.wf/2-self.wl, self.tw-self.wf/2-self.wl,
-             -self.wf/2, -self.wf/2, 0.0]
-        z = [0.0, 0.0, self.hw-self.tl, self.hw-self.tl, self.hw, self.hw,
-             self.tf, self.tf, self.tf, self.hw, self.hw, self.hw-self.tl,
-             self.hw-self.tl, 0.0, 0.0]
-        r = [0.0, 0.0, self.rl, 0.0, 0.0, 0.0, self.rf, 0.0,
-             self.rf, 0.0, 0.0, 0.0, self.rl, 0.0, 0.0]
+        y, z, r = self.outline(hw, tw, wf, tf, wl, tl, rf, rl)
         super().__init__(y, z, r, label=label)
+    @staticmethod
+    def outline(hw: float, tw: float, wf: float, tf: float,
+                wl: float, tl: float, rf: float=0.0, rl: float=0.0):
+        y = [0.0, wf/2, wf/2,
+             wf/2-tw+wl, wf/2-tw+wl,
+             wf/2-tw, wf/2-tw, 0.0, tw-wf/2, tw-wf/2,
+             tw-wf/2-wl, tw-wf/2-wl,
+             -wf/2, -wf/2, 0.0]
+        z = [0.0, 0.0, hw-tl, hw-tl, hw, hw,
+             tf, tf, tf, hw, hw, hw-tl,
+             hw-tl, 0.0, 0.0]
+        r = [0.0, 0.0, rl, 0.0, 0.0, 0.0, rf, 0.0,
+             rf, 0.0, 0.0, 0.0, rl, 0.0, 0.0]
+        return y, z, r
     def __repr__(self):
         if self.label is None:
             outstr = '<Omega-Section>'
@@ -1,8 +1,10 @@
+from math import pi
 from py2md.classes import MDTable
 from ..general.generalsection import GeneralSection
 from .. import config
 
 class RectangleSection(GeneralSection):
+    closedform = True
     h = None
     b = None
     rc = None
@@ -17,6 +19,11 @@ class RectangleSection(GeneralSection):
              self.h/2, self.h/2, -self.h/2]
         r = [self.rc, self.rc, self.rc, self.rc]
         super().__init__(y, z, r, label=label)
+    def calculate_moments(self):
+        if self.transformed:
+            super().calculate_moments()
+        else:
+            self.set_moments(*rectangle_moments(self.h, self.b, self.rc))
     def __repr__(self):
         if self.label is None:
             outstr = '<Rectangle-Section>'
@@ -33,3 +40,17 @@ class RectangleSection(GeneralSection):
         return mdstr
     def _repr_markdown_(self):
         return self.__str__()
+
+def rectangle_moments(h: float, b: float, rc: float=0.0):
+    # Core rectangle, two edge strips and four quarter circles at the corners.
+    hc = h-2*rc
+    bc = b-2*rc
+    yc = b/2-rc
+    zc = h/2-rc
+    Aq = pi*rc**2/4
+    Iq = pi*rc**4/16
+    Sq = rc**3/3
+    A = b*hc+2*bc*rc+4*Aq
+    Ayy = hc*b**3/12+2*rc*bc**3/12+4*(Aq*yc**2+2*yc*Sq+Iq)
+    Azz = b*hc**3/12+2*(bc*rc**3/12+bc*rc*(h/2-rc/2)**2)+4*(Aq*zc**2+2*zc*Sq+Iq)
+    return A, 0.0, 0.0, Ayy, Azz, 0.0
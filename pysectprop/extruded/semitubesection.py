@@ -1,8 +1,10 @@
+from math import pi
 from py2md.classes import MDTable
 from ..general.generalsection import GeneralSection
 from .. import config
 
 class SemiTubeSection(GeneralSection):
+    closedform = True
     do = None
     di = None
     def __init__(self, do: float, di: float, label: str=None):
@@ -10,10 +12,20 @@ class SemiTubeSection(GeneralSection):
         self.di = di
         ro = self.do/2
         ri = self.di/2
-        y = [ro, ro, -ro, -ro, -ri, -ri, ri, ri]
-        z = [0.0, ro, ro, 0.0, 0.0, ri, ri, 0.0]
-        r = [0.0, ro, ro, 0.0, 0.0, ri, ri, 0.0]
+        if ri > 0.0:
+            y = [ro, ro, -ro, -ro, -ri, -ri, ri, ri]
+            z = [0.0, ro, ro, 0.0, 0.0, ri, ri, 0.0]
+            r = [0.0, ro, ro, 0.0, 0.0, ri, ri, 0.0]
+        else:
+            y = [ro, ro, -ro, -ro, 0.0]
+            z = [0.0, ro, ro, 0.0, 0.0]
+            r = [0.0, ro, ro, 0.0, 0.0]
         super().__init__(y, z, r, label=label)
+    def calculate_moments(self):
+        if self.transformed:
+            super().calculate_moments()
+        else:
+            self.set_moments(*semitube_moments(self.do, self.di))
     def __repr__(self):
         if self.label is None:
             outstr = '<Semi-Tube-Section>'
@@ -30,3 +42,11 @@ class SemiTubeSection(GeneralSection):
         return mdstr
     def _repr_markdown_(self):
         return self.__str__()
+
+def semitube_moments(do: float, di: float):
+    ro = do/2
+    ri = di/2
+    A = pi*(ro**2-ri**2)/2
+    Az = 2*(ro**3-ri**3)/3
+    I = pi*(ro**4-ri**4)/8
+    return A, 0.0, Az, I, I, 0.0
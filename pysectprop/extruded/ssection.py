@@ -28,20 +28,30 @@ class SSection(GeneralSection):
         self.tl2 = tl2
         self.hl2 = hl2
         if tl1 != 0.0 and tl2 != 0.0: # Double Lip
-            y = [0.0, self.wf1, self.wf1, self.wf1 - self.tl1, self.wf1 - self.tl1, self.tw,
-                 self.tw, self.tw-self.wf2, self.tw-self.wf2, self.tw-self.wf2+self.tl2,
-                 self.tw-self.wf2+self.tl2, 0.0]
-            z = [0.0, 0.0, self.hl1, self.hl1, self.tf1, self.tf1,
-                 self.hw, self.hw, self.hw-self.hl2, self.hw-self.hl2,
-                 self.hw-self.tf2, self.hw-self.tf2]
-            r = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+            y, z, r = self.outline_double_lip(hw, tw, wf1, tf1, wf2, tf2, tl1, hl1, tl2, hl2)
         elif tl1 != 0.0: # Single Lip
-            y = [0.0, self.wf1, self.wf1, self.wf1 - self.tl1, self.wf1-self.tl1,
-                 self.tw, self.tw, self.tw-self.wf2, self.tw-self.wf2, 0.0]
-            z = [0.0, 0.0, self.hl1, self.hl1, self.tf1, self.tf1,self.hw, self.hw,
-                 self.hw-self.tf2, self.hw-self.tf2, self.hw-self.tf2]
-            r = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+            y, z, r = self.outline_single_lip(hw, tw, wf1, tf1, wf2, tf2, tl1, hl1)
         super().__init__(y, z, r, label=label)
+    @staticmethod
+    def outline_double_lip(hw: float, tw: float, wf1: float, tf1: float, wf2: float, tf2: float,
+                           tl1: float, hl1: float, tl2: float, hl2: float):
+        y = [0.0, wf1, wf1, wf1 - tl1, wf1 - tl1, tw,
+             tw, tw-wf2, tw-wf2, tw-wf2+tl2,
+             tw-wf2+tl2, 0.0]
+        z = [0.0, 0.0, hl1, hl1, tf1, tf1,
+             hw, hw, hw-hl2, hw-hl2,
+             hw-tf2, hw-tf2]
+        r = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        return y, z, r
+    @staticmethod
+    def outline_single_lip(hw: float, tw: float, wf1: float, tf1: float, wf2: float, tf2: float,
+                           tl1: float, hl1: float):
+        y = [0.0, wf1, wf1, wf1 - tl1, wf1-tl1,
+             tw, tw, tw-wf2, tw-wf2, 0.0]
+        z = [0.0, 0.0, hl1, hl1, tf1, tf1, hw, hw,
+             hw-tf2, hw-tf2]
+        r = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        return y, z, r
     def __repr__(self):
         if self.label is None:
             outstr = '<S-Section>'
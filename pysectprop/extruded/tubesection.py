@@ -1,8 +1,10 @@
+from math import pi
 from py2md.classes import MDTable
 from ..general.generalsection import GeneralSection
 from .. import config
 
 class TubeSection(GeneralSection):
+    closedform = True
     do = None
     di = None
     def __init__(self, do: float, di: float, label: str=None):
@@ -10,10 +12,18 @@ class TubeSection(GeneralSection):
         self.di = di
         ro = self.do/2
         ri = self.di/2
-        y = [ro, ro, -ro, -ro, ro, ro, ri, ri, -ri, -ri, ri, ri]
-        z = [0.0, ro, ro, -ro, -ro, 0.0, 0.0, -ri, -ri, ri, ri, 0.0]
-        r = [0.0, ro, ro, ro, ro, 0.0, 0.0, ri, ri, ri, ri, 0.0]
-        super().__init__(y, z, r, label=label)
+        y = [ro, -ro, -ro, ro]
+        z = [ro, ro, -ro, -ro]
+        r = [ro, ro, ro, ro]
+        holes = []
+        if ri > 0.0:
+            holes.append(([ri, ri, -ri, -ri], [ri, -ri, -ri, ri], [ri, ri, ri, ri]))
+        super().__init__(y, z, r, label=label, holes=holes)
+    def calculate_moments(self):
+        if self.transformed:
+            super().calculate_moments()
+        else:
+            self.set_moments(*tube_moments(self.do, self.di))
     def __repr__(self):
         if self.label is None:
             outstr = '<TubeSection>'
@@ -30,3 +40,8 @@ class TubeSection(GeneralSection):
         return mdstr
     def _repr_markdown_(self):
         return self.__str__()
+
+def tube_moments(do: float, di: float):
+    A = pi*(do**2-di**2)/4
+    I = pi*(do**4-di**4)/64
+    return A, 0.0, 0.0, I, I, 0.0
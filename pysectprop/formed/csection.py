@@ -15,15 +15,18 @@ class CSection(GeneralSection):
         self.wlf = wlf
         self.ts = ts
         self.rm = rm
-        y = [0.0, self.wlf, self.wlf, self.ts, self.ts, self.wuf, self.wuf, 0.0]
-        z = [0.0, 0.0, self.ts, self.ts, self.hw-self.ts, self.hw-self.ts, self.hw, self.hw]
-        if self.rm < self.ts/2:
-            r = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-        else:
-            ri = self.rm-self.ts/2
-            ro = self.rm+self.ts/2
-            r = [ro, 0.0, 0.0, ri, ri, 0.0, 0.0, ro]
+        y, z, r = self.outline(hw, wuf, wlf, ts, rm)
         super().__init__(y, z, r, label=label)
+    @staticmethod
+    def outline(hw: float, wuf: float, wlf: float, ts: float, rm: float):
+        y = [0.0, wlf, wlf, ts, ts, wuf, wuf, 0.0]
+        z = [0.0, 0.0, ts, ts, hw-ts, hw-ts, hw, hw]
+        # Corners are only rounded when the mean radius clears the inside face.
+        rnd = rm >= ts/2
+        ri = abs(rm-ts/2)*rnd
+        ro = abs(rm+ts/2)*rnd
+        r = [ro, 0.0, 0.0, ri, ri, 0.0, 0.0, ro]
+        return y, z, r
     def __repr__(self):
         if self.label is None:
             outstr = '<C-Section>'
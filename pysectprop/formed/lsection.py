@@ -17,15 +17,23 @@ class LSection(GeneralSection):
         self.rm = rm
         self.hl = hl
         if self.hl == 0.0:
-            y = [0.0, self.wf, self.wf, self.ts, self.ts, 0.0]
-            z = [0.0, 0.0, self.ts, self.ts, self.hw, self.hw]
-            r = [self.rm+self.ts/2, 0.0, 0.0, self.rm-self.ts/2, 0.0, 0.0]
+            y, z, r = self.outline(hw, wf, ts, rm)
         else:
-            y = [0.0, self.wf, self.wf, self.wf-self.ts, self.wf-self.ts, self.ts, self.ts, 0.0]
-            z = [0.0, 0.0, self.hl, self.hl, self.ts, self.ts, self.hw, self.hw]
-            r = [self.rm+self.ts/2, self.rm+self.ts/2, 0.0, 0.0,
-                 self.rm-self.ts/2, self.rm-self.ts/2, 0.0, 0.0]
+            y, z, r = self.outline_lipped(hw, wf, ts, rm, hl)
         super().__init__(y, z, r, label=label)
+    @staticmethod
+    def outline(hw: float, wf: float, ts: float, rm: float):
+        y = [0.0, wf, wf, ts, ts, 0.0]
+        z = [0.0, 0.0, ts, ts, hw, hw]
+        r = [rm+ts/2, 0.0, 0.0, rm-ts/2, 0.0, 0.0]
+        return y, z, r
+    @staticmethod
+    def outline_lipped(hw: float, wf: float, ts: float, rm: float, hl: float):
+        y = [0.0, wf, wf, wf-ts, wf-ts, ts, ts, 0.0]
+        z = [0.0, 0.0, hl, hl, ts, ts, hw, hw]
+        r = [rm+ts/2, rm+ts/2, 0.0, 0.0,
+             rm-ts/2, rm-ts/2, 0.0, 0.0]
+        return y, z, r
     def to_thin_walled(self):
         if self.hl == 0.0:
             y = [self.ts/2, self.ts/2, self.wf]
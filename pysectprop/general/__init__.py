@@ -4,3 +4,9 @@ from .compositesection import CompositeSection
 from .cripplingsection import CripplingSection
 from .thinwalledsection import ThinWalledSection
 from .material import Material
+from .sectionproperties import SectionProperties, StiffnessProperties
+from .propertycache import PropertyCache, property_cache
+from .propertystore import PropertyStore
+from .crippling import CripplingResult, crippling_allowables, material_crippling
+from .torsion import TorsionProperties
+from .thinwalledsection import WallTorsion
@@ -1,4 +1,6 @@
-from math import atan2
+from math import atan2, hypot
+from math import sin as fsin
+from numpy import absolute, arctan2, sin, sqrt
 from py2md.classes import MDTable
 from .point import Point
 from .. import config
@@ -144,7 +146,7 @@ class Arc(object):
             rad = self.radius
             sango2 = self.sango2
             sinphi = self.sinphi
-            self._Az_seg = 2/3*rad**3*sango2**3*sinphi+self._A_seg*zf
+            self._Az_seg = 2/3*rad**3*sango2**3*sinphi+self.A_seg*zf
         return self._Az_seg
     @property
     def Az_line(self):
@@ -172,7 +174,8 @@ class Arc(object):
             cosphi = self.cosphi
             Ayy = rad**4/8*(ang-sinang+2*sinang*sango2**2)
             Azz = rad**4/8*(ang-sinang-2*sinang*sango2**2/3)
-            self._Ayy_seg = Ayy*cosphi**2+Azz*sinphi**2+self.A_seg*yf**2
+            Ay = 2/3*rad**3*sango2**3*cosphi
+            self._Ayy_seg = Ayy*cosphi**2+Azz*sinphi**2+2*Ay*yf+self.A_seg*yf**2
         return self._Ayy_seg
     @property
     def Ayy_line(self):
@@ -200,7 +203,8 @@ class Arc(object):
             cosphi = self.cosphi
             Ayy = rad**4/8*(ang-sinang+2*sinang*sango2**2)
             Azz = rad**4/8*(ang-sinang-2*sinang*sango2**2/3)
-            self._Azz_seg = Azz*cosphi**2+Ayy*sinphi**2+self.A_seg*zf**2
+            Az = 2/3*rad**3*sango2**3*sinphi
+            self._Azz_seg = Azz*cosphi**2+Ayy*sinphi**2+2*Az*zf+self.A_seg*zf**2
         return self._Azz_seg
     @property
     def Azz_line(self):
@@ -230,7 +234,9 @@ class Arc(object):
             A_seg = rad**2/2*(ang-sinang)
             tempAyy = rad**4/8*(ang-sinang+2*sinang*sango2**2)
             tempAzz = rad**4/8*(ang-sinang-2*sinang*sango2**2/3)
-            self._Ayz_seg = (tempAyy-tempAzz)*sinphi*cosphi+A_seg*yf*zf
+            tempAy = 2/3*rad**3*sango2**3*cosphi
+            tempAz = 2/3*rad**3*sango2**3*sinphi
+            self._Ayz_seg = (tempAyy-tempAzz)*sinphi*cosphi+tempAy*zf+tempAz*yf+A_seg*yf*zf
         return self._Ayz_seg
     @property
     def Ayz_line(self):
@@ -282,12 +288,31 @@ class Arc(object):
         return self.__str__()
 
 def arc_from_points(pnta: Point, pntb: Point, pntc: Point, radius: float):
-    dy1 = pnta.y-pntb.y
-    dz1 = pnta.z-pntb.z
-    dy2 = pntc.y-pntb.y
-    dz2 = pntc.z-pntb.z
-    l1 = (dy1**2+dz1**2)**0.5
-    l2 = (dy2**2+dz2**2)**0.5
+    yd, zd, ye, ze, yf, zf = fillet_points(pnta.y, pnta.z, pntb.y, pntb.z,
+                                           pntc.y, pntc.z, radius)
+    pntd = Point(float(yd), float(zd))
+    pnte = Point(float(ye), float(ze))
+    pntf = Point(float(yf), float(zf))
+    arc = Arc(pntd, pnte, pntb, pntf)
+    return arc
+
+def determine_pntf(ya, za, va, wa, yb, zb, vb, wb):
+    yf, zf = determine_yzf(ya, za, va, wa, yb, zb, vb, wb)
+    return Point(yf, zf)
+
+def determine_yzf(ya, za, va, wa, yb, zb, vb, wb):
+    lbres = (va*za-va*zb-wa*ya+wa*yb)/(va*wb-vb*wa)
+    yf = vb*lbres+yb
+    zf = wb*lbres+zb
+    return yf, zf
+
+def fillet_points(ya, za, yb, zb, yc, zc, radius):
+    dy1 = ya-yb
+    dz1 = za-zb
+    dy2 = yc-yb
+    dz2 = zc-zb
+    l1 = sqrt(dy1**2+dz1**2)
+    l2 = sqrt(dy2**2+dz2**2)
     dy1 = dy1/l1
     dz1 = dz1/l1
     dy2 = dy2/l2
@@ -295,19 +320,94 @@ def arc_from_points(pnta: Point, pntb: Point, pntc: Point, radius: float):
     sinab = dy2*dz1-dz2*dy1
     cosab = dy1*dy2+dz1*dz2
     cotabo2 = (1+cosab)/sinab
-    lp = abs(radius*cotabo2)
-    yd = pntb.y+dy1*lp
-    zd = pntb.z+dz1*lp
-    ye = pntb.y+dy2*lp
-    ze = pntb.z+dz2*lp
-    pntf = determine_pntf(yd, zd, -dz1, dy1, ye, ze, -dz2, dy2)
-    pntd = Point(yd, zd)
-    pnte = Point(ye, ze)
-    arc = Arc(pntd, pnte, pntb, pntf)
-    return arc
+    lp = absolute(radius*cotabo2)
+    yd = yb+dy1*lp
+    zd = zb+dz1*lp
+    ye = yb+dy2*lp
+    ze = zb+dz2*lp
+    yf, zf = determine_yzf(yd, zd, -dz1, dy1, ye, ze, -dz2, dy2)
+    return yd, zd, ye, ze, yf, zf
 
-def determine_pntf(ya, za, va, wa, yb, zb, vb, wb):
-    lbres = (va*za-va*zb-wa*ya+wa*yb)/(va*wb-vb*wa)
-    yf = vb*lbres+yb
-    zf = wb*lbres+zb
-    return Point(yf, zf)
+def segment_moments(yd, zd, ye, ze, yc, zc, yf, zf):
+    dy3 = yd-yf
+    dz3 = zd-zf
+    dy4 = ye-yf
+    dz4 = ze-zf
+    rad2 = dy3**2+dz3**2
+    sinang = (dy3*dz4-dz3*dy4)/rad2
+    ang = arctan2(sinang, (dy3*dy4+dz3*dz4)/rad2)
+    sango2 = sin(ang/2)
+    ycf = yc-yf
+    zcf = zc-zf
+    lcf = sqrt(ycf**2+zcf**2)
+    sinphi = zcf/lcf
+    cosphi = ycf/lcf
+    A = rad2/2*(ang-sinang)
+    tempA1 = 2/3*rad2*sqrt(rad2)*sango2**3
+    tempAy = tempA1*cosphi
+    tempAz = tempA1*sinphi
+    tempAyy = rad2**2/8*(ang-sinang+2*sinang*sango2**2)
+    tempAzz = rad2**2/8*(ang-sinang-2*sinang*sango2**2/3)
+    Ay = tempAy+A*yf
+    Az = tempAz+A*zf
+    Ayy = tempAyy*cosphi**2+tempAzz*sinphi**2+2*tempAy*yf+A*yf**2
+    Azz = tempAzz*cosphi**2+tempAyy*sinphi**2+2*tempAz*zf+A*zf**2
+    Ayz = (tempAyy-tempAzz)*sinphi*cosphi+tempAy*zf+tempAz*yf+A*yf*zf
+    return A, Ay, Az, Ayy, Azz, Ayz
+
+def fillet_segment(ya, za, yb, zb, yc, zc, radius):
+    # Float form of fillet_points and segment_moments for a single corner.
+    dy1 = ya-yb
+    dz1 = za-zb
+    dy2 = yc-yb
+    dz2 = zc-zb
+    l1 = hypot(dy1, dz1)
+    l2 = hypot(dy2, dz2)
+    dy1, dz1 = dy1/l1, dz1/l1
+    dy2, dz2 = dy2/l2, dz2/l2
+    sinab = dy2*dz1-dz2*dy1
+    cosab = dy1*dy2+dz1*dz2
+    lp = abs(radius*(1+cosab)/sinab)
+    yd, zd = yb+dy1*lp, zb+dz1*lp
+    ye, ze = yb+dy2*lp, zb+dz2*lp
+    yf, zf = determine_yzf(yd, zd, -dz1, dy1, ye, ze, -dz2, dy2)
+    dy3, dz3 = yd-yf, zd-zf
+    dy4, dz4 = ye-yf, ze-zf
+    rad2 = dy3**2+dz3**2
+    sinang = (dy3*dz4-dz3*dy4)/rad2
+    ang = atan2(sinang, (dy3*dy4+dz3*dz4)/rad2)
+    sango2 = fsin(ang/2)
+    ycf, zcf = yb-yf, zb-zf
+    lcf = hypot(ycf, zcf)
+    sinphi = zcf/lcf
+    cosphi = ycf/lcf
+    A = rad2/2*(ang-sinang)
+    tempA1 = 2/3*rad2*rad2**0.5*sango2**3
+    tempAy = tempA1*cosphi
+    tempAz = tempA1*sinphi
+    tempAyy = rad2**2/8*(ang-sinang+2*sinang*sango2**2)
+    tempAzz = rad2**2/8*(ang-sinang-2*sinang*sango2**2/3)
+    Ay = tempAy+A*yf
+    Az = tempAz+A*zf
+    Ayy = tempAyy*cosphi**2+tempAzz*sinphi**2+2*tempAy*yf+A*yf**2
+    Azz = tempAzz*cosphi**2+tempAyy*sinphi**2+2*tempAz*zf+A*zf**2
+    Ayz = (tempAyy-tempAzz)*sinphi*cosphi+tempAy*zf+tempAz*yf+A*yf*zf
+    return yd, zd, ye, ze, (A, Ay, Az, Ayy, Azz, Ayz)
+
+def chord_moments(yd, zd, ye, ze):
+    cr = yd*ze-zd*ye
+    A = cr/2
+    Ay = cr*(yd+ye)/6
+    Az = cr*(zd+ze)/6
+    Ayy = (yd**2+yd*ye+ye**2)*cr/12
+    Azz = (zd**2+zd*ze+ze**2)*cr/12
+    Ayz = (yd*ze+2*yd*zd+2*ye*ze+ye*zd)*cr/24
+    return A, Ay, Az, Ayy, Azz, Ayz
+
+def fillet_moments(ya, za, yb, zb, yc, zc, radius, chord: bool=True):
+    yd, zd, ye, ze, yf, zf = fillet_points(ya, za, yb, zb, yc, zc, radius)
+    moments = segment_moments(yd, zd, ye, ze, yb, zb, yf, zf)
+    if chord:
+        chords = chord_moments(yd, zd, ye, ze)
+        moments = tuple(ms+mc for ms, mc in zip(moments, chords))
+    return moments
@@ -1,11 +1,13 @@
 from math import cos, sin, pi, atan, degrees
 from matplotlib.pyplot import figure
-from matplotlib.path import Path
 from matplotlib.patches import PathPatch, Patch
 from matplotlib.collections import PatchCollection
 from matplotlib.pyplot import rcParams
 from py2md.classes import MDHeading, MDTable
 from ..results.sectionresult import SectionResult
+from ..results.batchresult import BatchResult
+from ..results.loadresponse import LoadResponse
+from .sectionproperties import StiffnessProperties, stiffness_from_moments
 from .. import config
 
 class CompositeSection(object):
@@ -43,6 +45,34 @@ class CompositeSection(object):
         self._θp = None
         self._EIyp = None
         self._EIzp = None
+    def compute(self):
+        EA, EAy, EAz, EAyy, EAzz, EAyz = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+        for section in self.sections:
+            stiff = section.compute_stiffness()
+            EA += stiff.EA
+            EAy += stiff.EAy
+            EAz += stiff.EAz
+            EAyy += stiff.EAyy
+            EAzz += stiff.EAzz
+            EAyz += stiff.EAyz
+        stiff = stiffness_from_moments(EA, EAy, EAz, EAyy, EAzz, EAyz)
+        self.set_stiffness(stiff)
+        return stiff
+    def set_stiffness(self, stiff: StiffnessProperties):
+        self._EA = stiff.EA
+        self._EAy = stiff.EAy
+        self._EAz = stiff.EAz
+        self._cy = stiff.cy
+        self._cz = stiff.cz
+        self._EAyy = stiff.EAyy
+        self._EAzz = stiff.EAzz
+        self._EAyz = stiff.EAyz
+        self._EIyy = stiff.EIyy
+        self._EIzz = stiff.EIzz
+        self._EIyz = stiff.EIyz
+        self._θp = stiff.θp
+        self._EIyp = stiff.EIyp
+        self._EIzp = stiff.EIzp
     @property
     def EA(self):
         if self._EA is None:
@@ -146,12 +176,7 @@ class CompositeSection(object):
         y, z = [], []
         legel = []
         for i, section in enumerate(self.sections):
-            verts = []
-            codes = []
-            for obj in section.path:
-                obj.add_path(verts, codes)
-            path = Path(verts, codes)
-            patch = PathPatch(path)
+            patch = PathPatch(section.plot_path())
             y += section.y
             z += section.z
             patches.append(patch)
@@ -173,6 +198,15 @@ class CompositeSection(object):
             sectresult.set_load(loadcase, Fx, My, Mz, limit=limit)
             sectresults.append(sectresult)
         return sectresults
+    def apply_loads(self, loadcases: list, loads, limit: bool=False, critical: bool=False):
+        batchresults = []
+        for section in self.sections:
+            batchresult = BatchResult(section, totalsection=self, critical=critical)
+            batchresult.set_loads(loadcases, loads, limit=limit)
+            batchresults.append(batchresult)
+        return batchresults
+    def load_response(self, critical: bool=False):
+        return LoadResponse(self, critical=critical)
     def __repr__(self):
         if self.label is None:
             outstr = '<CompositeSection>'
@@ -0,0 +1,40 @@
+from typing import NamedTuple
+from numpy import asarray, minimum, ndarray, newaxis, sqrt, where
+from .thinwalledsection import WallArrays
+
+class CripplingResult(NamedTuple):
+    b: ndarray
+    t: ndarray
+    C: ndarray
+    Acc: ndarray
+    Fcc: ndarray
+    Pcc: ndarray
+    Fcc_sec: ndarray
+    Pcc_sec: ndarray
+
+def crippling_allowables(walls: WallArrays, Ec, Fcy, coef, cnef):
+    # Material and coefficient inputs broadcast over the leading axes,
+    # segments run along the last axis.
+    Ec = asarray(Ec, dtype=float)[..., newaxis]
+    Fcy = asarray(Fcy, dtype=float)[..., newaxis]
+    coef = asarray(coef, dtype=float)[..., newaxis]
+    cnef = asarray(cnef, dtype=float)[..., newaxis]
+    oef = walls.fa | walls.fb
+    b = walls.ls
+    t = walls.ts
+    C = where(oef, coef, cnef)
+    bt = where(oef, b/t, b/2/t)
+    Fcc = minimum(sqrt(Ec*Fcy)*C/bt**0.75, Fcy)
+    Acc = b*t
+    Pcc = Fcc*Acc
+    Pcc_sec = Pcc.sum(axis=-1)
+    Fcc_sec = Pcc_sec/Acc.sum(axis=-1)
+    return CripplingResult(b, t, C, Acc, Fcc, Pcc, Fcc_sec, Pcc_sec)
+
+def material_crippling(walls: WallArrays, materials: list, coef, cnef):
+    # Result axes are (material, coefficient pair, segment).
+    Ec = asarray([material.Ec for material in materials], dtype=float)[:, newaxis]
+    Fcy = asarray([material.Fcy for material in materials], dtype=float)[:, newaxis]
+    coef = asarray(coef, dtype=float).ravel()[newaxis, :]
+    cnef = asarray(cnef, dtype=float).ravel()[newaxis, :]
+    return crippling_allowables(walls, Ec, Fcy, coef, cnef)
@@ -1,6 +1,8 @@
 from math import degrees
 from py2md.classes import MDHeading, MDTable
+from .crippling import crippling_allowables
 from .thinwalledsection import ThinWalledSection
+from .sectionproperties import StiffnessProperties, stiffness_from_moments
 from .. import config
 
 class CripplingSection(ThinWalledSection):
@@ -18,9 +20,13 @@ class CripplingSection(ThinWalledSection):
     _EIzp = None
     coef = None
     cnef = None
+    _crip = None
+    _Fcc = None
+    _Pcc = None
     def __init__(self, section, material, coef: float, cnef: float):
         if isinstance(section, ThinWalledSection):
-            super().__init__(section.y, section.z, section.t, label=section.label)
+            super().__init__(section.y, section.z, section.t, label=section.label,
+                             edges=section.edges)
             for k in section.__dict__:
                 self.__dict__[k] = section.__dict__[k]
         self.material = material
@@ -81,6 +87,52 @@ class CripplingSection(ThinWalledSection):
         if self._EIzp is None:
             self._EIzp = self.material.Ec*self.Izp
         return self._EIzp
+    def compute_stiffness(self):
+        if self._A is None:
+            self.calculate_moments()
+        E = self.material.Ec
+        stiff = stiffness_from_moments(E*self._A, E*self._Ay, E*self._Az,
+                                       E*self._Ayy, E*self._Azz, E*self._Ayz)
+        self.set_stiffness(stiff)
+        return stiff
+    def set_stiffness(self, stiff: StiffnessProperties):
+        self._EA = stiff.EA
+        self._EAy = stiff.EAy
+        self._EAz = stiff.EAz
+        self._EAyy = stiff.EAyy
+        self._EAzz = stiff.EAzz
+        self._EAyz = stiff.EAyz
+        self._EIyy = stiff.EIyy
+        self._EIzz = stiff.EIzz
+        self._EIyz = stiff.EIyz
+        self._EIyp = stiff.EIyp
+        self._EIzp = stiff.EIzp
+    def reset(self):
+        self._crip = None
+        self._Fcc = None
+        self._Pcc = None
+        super().reset()
+    def calculate_crippling(self):
+        result = crippling_allowables(self.walls, self.material.Ec, self.material.Fcy,
+                                      self.coef, self.cnef)
+        self._crip = result
+        self._Fcc = float(result.Fcc_sec)
+        self._Pcc = float(result.Pcc_sec)
+    @property
+    def crippling(self):
+        if self._crip is None:
+            self.calculate_crippling()
+        return self._crip
+    @property
+    def Fcc(self):
+        if self._Fcc is None:
+            self.calculate_crippling()
+        return self._Fcc
+    @property
+    def Pcc(self):
+        if self._Pcc is None:
+            self.calculate_crippling()
+        return self._Pcc
     def __repr__(self):
         if self.label is None:
             outstr = '<CripplingSection>'
@@ -108,7 +160,7 @@ class CripplingSection(ThinWalledSection):
         table.add_column(f'EAy ({funit:s}.{lunit:s})', l3frm, data=[self.EAy])
         table.add_column(f'EAz ({funit:s}.{lunit:s})', l3frm, data=[self.EAz])
         table.add_column(f'cy ({lunit:s})', l1frm, data=[self.cy])
-        table.add_column(f'cz ({lunit:s})', l1frm, data=[self.cy])
+        table.add_column(f'cz ({lunit:s})', l1frm, data=[self.cz])
         table.add_column(f'EAyy ({eiunit:s})', l4frm, data=[self.EAyy])
         table.add_column(f'EAzz ({eiunit:s})', l4frm, data=[self.EAzz])
         table.add_column(f'EAyz ({eiunit:s})', l4frm, data=[self.EAyz])
@@ -121,14 +173,14 @@ class CripplingSection(ThinWalledSection):
         table.add_column(f'EI<sub>yp</sub> ({eiunit:s})', l4frm, data=[self.EIyp])
         table.add_column(f'EI<sub>zp</sub> ({eiunit:s})', l4frm, data=[self.EIzp])
         mdstr += str(table)
-        Ec = self.material.Ec
-        Fcy = self.material.Fcy
         table = MDTable()
         table.add_column(f'E<sub>c</sub> ({sunit:s})', '.0f', data=[self.material.Ec])
         table.add_column(f'F<sub>cy</sub> ({sunit:s})', '.0f', data=[self.material.Fcy])
         table.add_column('C<sub>oef</sub>', '.3f', data=[self.coef])
         table.add_column('C<sub>nef</sub>', '.3f', data=[self.cnef])
         mdstr += str(table)
+        crip = self.crippling
+        table = MDTable()
         table.add_column('#', '')
         table.add_column(f'b ({lunit:s})', '')
         table.add_column(f't ({lunit:s})', '')
@@ -136,24 +188,10 @@ class CripplingSection(ThinWalledSection):
         table.add_column(f'A ({lunit:s}<sup>2</sup>)', '.1f')
         table.add_column(f'F ({sunit:s})', '.1f')
         table.add_column(f'P ({funit:s})', '.0f')
-        Acc_tot = 0.0
-        Pcc_tot = 0.0
-        for ind, seg in enumerate(self.__dict__['segs']):
-            b = seg.ls
-            t = seg.ts
-            if seg.is_oef():
-                cef = self.coef
-                Fcc = min([(Ec*Fcy)**0.5*cef/(b/t)**0.75, Fcy])
-            if seg.is_nef():
-                cef = self.cnef
-                Fcc = min([(Ec*Fcy)**0.5*cef/(b/2/t)**0.75, Fcy])
-            Acc = seg.A
-            Pcc = Fcc*Acc
-            Pcc_tot += Pcc
-            Acc_tot += Acc
-            table.add_row([ind, b, t, cef, Acc, Fcc, Pcc])
-        Fcc_tot = Pcc_tot/Acc_tot
-        table.add_row(['Total', '', '', '', Acc_tot, Fcc_tot, Pcc_tot])
+        for ind in range(crip.b.size):
+            table.add_row([ind, float(crip.b[ind]), float(crip.t[ind]), float(crip.C[ind]),
+                           float(crip.Acc[ind]), float(crip.Fcc[ind]), float(crip.Pcc[ind])])
+        table.add_row(['Total', '', '', '', float(crip.Acc.sum()), self.Fcc, self.Pcc])
         mdstr += str(table)
         return mdstr
     def _repr_markdown_(self):
@@ -1,18 +1,29 @@
 from math import atan, cos, sin, degrees, pi, radians
 from matplotlib.pyplot import figure
+from numpy import arange, asarray, empty, zeros
 from py2md.classes import MDHeading, MDTable
 from .point import Point
 from .line import Line
-from .arc import Arc, arc_from_points
+from .arc import Arc, arc_from_points, fillet_points, fillet_segment, segment_moments
+from .mesh import section_mesh
+from .polygon import contour_index, convex_hull_index, cyclic_index, polygon_moments
+from .propertycache import fingerprint, property_cache
+from .sectionproperties import SectionProperties, properties_from_moments, transform_moments
+from .torsion import section_torsion
 from .. import config
 
 class GeneralSection(object):
     y = None
     z = None
     r = None
+    holes = None
     label = None
-    pnts = None
-    path = None
+    transformed = False
+    closedform = False
+    _pnts = None
+    _path = None
+    _paths = None
+    _hull = None
     _A = None
     _Ay = None
     _Az = None
@@ -27,87 +38,139 @@ class GeneralSection(object):
     _θp = None
     _Iyp = None
     _Izp = None
-    def __init__(self, y: list, z: list, r: list, label: str=None):
-        newy, newz, newr = cleanup_points(y, z, r)
-        self.y = newy
-        self.z = newz
-        self.r = newr
+    def __init__(self, y: list, z: list, r: list, label: str=None, holes: list=None):
+        if self.closedform:
+            # Closed-form primitives build clean, correctly oriented contours.
+            self.y, self.z, self.r = y, z, r
+            self.holes = [] if holes is None else [list(hole) for hole in holes]
+        else:
+            newy, newz, newr = cleanup_points(y, z, r)
+            self.y = newy
+            self.z = newz
+            self.r = newr
+            self.holes = []
+            if holes is not None:
+                for hy, hz, hr in holes:
+                    self.holes.append(list(cleanup_points(hy, hz, hr)))
         if label is not None:
             self.label = label
-        self.generate_path()
         self.check_area()
+    @property
+    def contours(self):
+        return [(self.y, self.z, self.r)]+[tuple(hole) for hole in self.holes]
     def check_area(self, display=True):
-        self._A = None
-        if self.A < 0.0:
+        if self.closedform and not self.transformed:
+            self.calculate_moments()
+            return
+        # Holes run clockwise so that they subtract from the outer contour.
+        for hy, hz, hr in self.holes:
+            if polygon_moments(hy, hz)[0] > 0.0:
+                hy.reverse()
+                hz.reverse()
+                hr.reverse()
+        self.calculate_moments()
+        if self._A < 0.0:
             if display:
                 print('Reversed coordinates.')
             self.y.reverse()
             self.z.reverse()
             self.r.reverse()
-            self.generate_path()
-        self._A = None
+            self._path = None
+            self.calculate_moments()
     def generate_path(self):
-        numpnt = len(self.r)
-        pnts = []
-        for i in range(numpnt):
-            yi = self.y[i]
-            zi = self.z[i]
-            pnts.append(Point(yi, zi))
-        lines = []
-        for i in range(numpnt):
-            a = i
-            b = i+1
-            if b == numpnt:
-                b = 0
-            pnta = pnts[a]
-            pntb = pnts[b]
-            line = Line(pnta, pntb)
-            lines.append(line)
-        arcs = []
-        for i in range(numpnt):
-            radius = self.r[i]
-            if i == 0:
-                a = -1
-            else:
-                a = i-1
-            b = i
-            linea = lines[a]
-            lineb = lines[b]
-            pnta = linea.pnta
-            pntb = linea.pntb
-            pntc = lineb.pntb
-            if radius != 0.0:
-                arc = arc_from_points(pnta, pntb, pntc, radius)
-            else:
-                arc = None
-            arcs.append(arc)
-        lentol = 1e-12
-        path = []
-        for i in range(numpnt):
-            a = i
-            b = i+1
-            if b == numpnt:
-                b = 0
-            arca = arcs[a]
-            arcb = arcs[b]
-            linea = lines[a]
-            if arca is None:
-                pnta = linea.pnta
-            else:
-                path.append(arca)
-                pnta = arca.pntb
-            if arcb is None:
-                pntb = linea.pntb
-            else:
-                pntb = arcb.pnta
-            line = Line(pnta, pntb)
-            if line.length > lentol:
-                path.append(line)
-        self.path = path
-        self.pnts = []
-        for obj in path:
-            self.pnts.append(obj.pnta)
+        self._paths = [contour_path(y, z, r) for y, z, r in self.contours]
+        self._path = [obj for path in self._paths for obj in path]
+        self._hull = None
+        self._pnts = []
+        for obj in self._path:
+            self._pnts.append(obj.pnta)
+    @property
+    def path(self):
+        if self._path is None:
+            self.generate_path()
+        return self._path
+    @property
+    def pnts(self):
+        if self._path is None:
+            self.generate_path()
+        return self._pnts
+    def fingerprint(self):
+        holes = [values for hole in self.holes for values in hole]
+        return fingerprint('general', self.y, self.z, self.r, *holes)
+    def mesh(self, size: float=None, tol: float=None):
+        return section_mesh(self, size=size, tol=tol)
+    def torsion(self, size: float=None, tol: float=None, nu: float=0.0):
+        return section_torsion(self, size=size, tol=tol, nu=nu)
+    @property
+    def hull(self):
+        pnts = self.pnts
+        if self._hull is None:
+            y = [pnt.y for pnt in pnts]
+            z = [pnt.z for pnt in pnts]
+            self._hull = convex_hull_index(y, z)
+        return self._hull
+    def contour_moments(self):
+        if len(self.holes) == 0:
+            return outline_moments(self.y, self.z, self.r)
+        y, z, r, counts = [], [], [], []
+        for cy, cz, cr in self.contours:
+            y += cy
+            z += cz
+            r += cr
+            counts.append(len(cy))
+        return outline_moments(y, z, r, counts)
+    def calculate_moments(self):
+        key, props = None, None
+        if property_cache.enabled:
+            key = self.fingerprint()
+            props = property_cache.get(key)
+        if props is None:
+            A, Ay, Az, Ayy, Azz, Ayz = self.contour_moments()
+            props = properties_from_moments(float(A), float(Ay), float(Az),
+                                            float(Ayy), float(Azz), float(Ayz))
+            if key is not None:
+                property_cache.put(key, props)
+        self.set_properties(props)
+    def set_moments(self, A: float, Ay: float, Az: float,
+                    Ayy: float, Azz: float, Ayz: float):
+        self._A = A
+        self._Ay = Ay
+        self._Az = Az
+        self._cy = None
+        self._cz = None
+        self._Ayy = Ayy
+        self._Azz = Azz
+        self._Ayz = Ayz
+        self._Iyy = None
+        self._Izz = None
+        self._Iyz = None
+        self._θp = None
+        self._Iyp = None
+        self._Izp = None
+    def compute(self):
+        if self._A is None:
+            self.calculate_moments()
+        props = properties_from_moments(self._A, self._Ay, self._Az,
+                                        self._Ayy, self._Azz, self._Ayz)
+        self.set_properties(props)
+        return props
+    def set_properties(self, props: SectionProperties):
+        self._A = props.A
+        self._Ay = props.Ay
+        self._Az = props.Az
+        self._cy = props.cy
+        self._cz = props.cz
+        self._Ayy = props.Ayy
+        self._Azz = props.Azz
+        self._Ayz = props.Ayz
+        self._Iyy = props.Iyy
+        self._Izz = props.Izz
+        self._Iyz = props.Iyz
+        self._θp = props.θp
+        self._Iyp = props.Iyp
+        self._Izp = props.Izp
     def reset(self):
+        self._path = None
         self._A = None
         self._Ay = None
         self._Az = None
@@ -123,57 +186,53 @@ class GeneralSection(object):
         self._Iyp = None
         self._Izp = None
         self.check_area(display=False)
+    def transform(self, a: float, b: float, c: float, d: float,
+                  yt: float=0.0, zt: float=0.0):
+        if self._A is None:
+            self.calculate_moments()
+        moments = transform_moments(self._A, self._Ay, self._Az,
+                                    self._Ayy, self._Azz, self._Ayz,
+                                    a, b, c, d, yt, zt)
+        contours = []
+        for cy, cz, cr in self.contours:
+            y = [a*yi+b*zi+yt for yi, zi in zip(cy, cz)]
+            z = [c*yi+d*zi+zt for yi, zi in zip(cy, cz)]
+            r = list(cr)
+            if a*d-b*c < 0.0:
+                y.reverse()
+                z.reverse()
+                r.reverse()
+            contours.append([y, z, r])
+        self.y, self.z, self.r = contours[0]
+        self.holes = contours[1:]
+        self._path = None
+        self.transformed = True
+        self.set_moments(*moments)
     def mirror_y(self):
-        z = [-zi for zi in self.z]
-        self.z = z
-        self.reset()
-        self.generate_path()
-        self.check_area(display=False)
+        self.transform(1.0, 0.0, 0.0, -1.0)
     def mirror_z(self):
-        y = [-yi for yi in self.y]
-        self.y = y
-        self.reset()
-        self.generate_path()
-        self.check_area(display=False)
+        self.transform(-1.0, 0.0, 0.0, 1.0)
     def translate(self, yt: float, zt: float):
-        y = [-yi+yt for yi in self.y]
-        self.y = y
-        z = [-zi+zt for zi in self.z]
-        self.z = z
-        self.reset()
-        self.generate_path()
-        self.check_area(display=False)
+        self.transform(1.0, 0.0, 0.0, 1.0, yt, zt)
     def rotate(self, θr: float):
         thrad = radians(θr)
         costh = cos(thrad)
         sinth = sin(thrad)
-        y = [yi*costh-zi*sinth for yi, zi in zip(self.y, self.z)]
-        z = [zi*costh+yi*sinth for yi, zi in zip(self.y, self.z)]
-        self.y = y
-        self.z = z
-        self.reset()
-        self.generate_path()
-        self.check_area(display=False)
+        self.transform(costh, -sinth, sinth, costh)
     @property
     def A(self):
         if self._A is None:
-            self._A = 0.0
-            for obj in self.path:
-                self._A += obj.A
+            self.calculate_moments()
         return self._A
     @property
     def Ay(self):
         if self._Ay is None:
-            self._Ay = 0.0
-            for obj in self.path:
-                self._Ay += obj.Ay
+            self.calculate_moments()
         return self._Ay
     @property
     def Az(self):
         if self._Az is None:
-            self._Az = 0.0
-            for obj in self.path:
-                self._Az += obj.Az
+            self.calculate_moments()
         return self._Az
     @property
     def cy(self):
@@ -188,23 +247,17 @@ class GeneralSection(object):
     @property
     def Ayy(self):
         if self._Ayy is None:
-            self._Ayy = 0.0
-            for obj in self.path:
-                self._Ayy += obj.Ayy
+            self.calculate_moments()
         return self._Ayy
     @property
     def Azz(self):
         if self._Azz is None:
-            self._Azz = 0.0
-            for obj in self.path:
-                self._Azz += obj.Azz
+            self.calculate_moments()
         return self._Azz
     @property
     def Ayz(self):
         if self._Ayz is None:
-            self._Ayz = 0.0
-            for obj in self.path:
-                self._Ayz += obj.Ayz
+            self.calculate_moments()
         return self._Ayz
     @property
     def Iyy(self):
@@ -225,19 +278,26 @@ class GeneralSection(object):
         if ax is None:
             fig = figure(figsize=(12, 8))
             ax = fig.gca()
-        from matplotlib.path import Path
         from matplotlib.patches import PathPatch
-        verts = []
-        codes = []
-        for obj in self.path:
-            obj.add_path(verts, codes)
-        path = Path(verts, codes)
-        patch = PathPatch(path, alpha=0.8)
+        patch = PathPatch(self.plot_path(), alpha=0.8)
         ax.set_aspect('equal')
         ax.add_patch(patch)
         ax.set_xlim(min(self.y), max(self.y))
         ax.set_ylim(min(self.z), max(self.z))
         return ax
+    def plot_path(self):
+        from matplotlib.path import Path
+        verts = []
+        codes = []
+        if self._path is None:
+            self.generate_path()
+        for contour in self._paths:
+            cverts, ccodes = [], []
+            for obj in contour:
+                obj.add_path(cverts, ccodes)
+            verts += cverts
+            codes += ccodes
+        return Path(verts, codes)
     def plot_arc_control(self, ax=None):
         if ax is None:
             fig = figure(figsize=(12, 8))
@@ -335,6 +395,65 @@ class GeneralSection(object):
     def _repr_markdown_(self):
         return self.__str__()
 
+def contour_path(y: list, z: list, r: list):
+    numpnt = len(r)
+    pnts = []
+    for i in range(numpnt):
+        yi = y[i]
+        zi = z[i]
+        pnts.append(Point(yi, zi))
+    lines = []
+    for i in range(numpnt):
+        a = i
+        b = i+1
+        if b == numpnt:
+            b = 0
+        pnta = pnts[a]
+        pntb = pnts[b]
+        line = Line(pnta, pntb)
+        lines.append(line)
+    arcs = []
+    for i in range(numpnt):
+        radius = r[i]
+        if i == 0:
+            a = -1
+        else:
+            a = i-1
+        b = i
+        linea = lines[a]
+        lineb = lines[b]
+        pnta = linea.pnta
+        pntb = linea.pntb
+        pntc = lineb.pntb
+        if radius != 0.0:
+            arc = arc_from_points(pnta, pntb, pntc, radius)
+        else:
+            arc = None
+        arcs.append(arc)
+    lentol = 1e-12
+    path = []
+    for i in range(numpnt):
+        a = i
+        b = i+1
+        if b == numpnt:
+            b = 0
+        arca = arcs[a]
+        arcb = arcs[b]
+        linea = lines[a]
+        if arca is None:
+            pnta = linea.pnta
+        else:
+            path.append(arca)
+            pnta = arca.pntb
+        if arcb is None:
+            pntb = linea.pntb
+        else:
+            pntb = arcb.pnta
+        line = Line(pnta, pntb)
+        if line.length > lentol:
+            path.append(line)
+    return path
+
 def cleanup_points(y, z, r):
     keep = []
     num = len(y)
@@ -357,3 +476,84 @@ def cleanup_points(y, z, r):
         else:
             print('Duplicate point removed!')
     return newy, newz, newr
+
+# Outlines up to this many vertices are integrated with plain floats, below
+# it numpy call overhead outweighs the vectorised loop.
+scalarsize = 32
+
+def outline_moments(y, z, r, counts: list=None):
+    # With counts, y, z and r hold several contours end to end.
+    if isinstance(y, list) and len(y) <= scalarsize:
+        return scalar_outline_moments(y, z, r, counts)
+    y = asarray(y, dtype=float)
+    z = asarray(z, dtype=float)
+    r = asarray(r, dtype=float)
+    num = y.shape[-1]
+    if counts is None:
+        prv = cyclic_index(num, -1)
+        nxt = cyclic_index(num, 1)
+    else:
+        prv = contour_index(counts, -1)
+        nxt = contour_index(counts, 1)
+    chk = r != 0.0
+    if not chk.any():
+        return polygon_moments(y, z, nxt)
+    shp = y.shape[:-1]+(2*num,)
+    yt, zt = empty(shp), empty(shp)
+    yt[..., 0::2], zt[..., 0::2] = y, z
+    yt[..., 1::2], zt[..., 1::2] = y, z
+    nxtt = empty(2*num, dtype=int)
+    nxtt[0::2] = arange(1, 2*num, 2)
+    nxtt[1::2] = 2*nxt
+    ya, za = y.take(prv, axis=-1)[chk], z.take(prv, axis=-1)[chk]
+    yb, zb = y[chk], z[chk]
+    yc, zc = y.take(nxt, axis=-1)[chk], z.take(nxt, axis=-1)[chk]
+    yd, zd, ye, ze, yf, zf = fillet_points(ya, za, yb, zb, yc, zc, r[chk])
+    yt[..., 0::2][chk], zt[..., 0::2][chk] = yd, zd
+    yt[..., 1::2][chk], zt[..., 1::2][chk] = ye, ze
+    moments = polygon_moments(yt, zt, nxtt)
+    segs = segment_moments(yd, zd, ye, ze, yb, zb, yf, zf)
+    result = []
+    for mom, seg in zip(moments, segs):
+        tot = zeros(y.shape)
+        tot[chk] = seg
+        result.append(mom+tot.sum(axis=-1))
+    return tuple(result)
+
+def scalar_outline_moments(y: list, z: list, r: list, counts: list=None):
+    if counts is None:
+        counts = [len(y)]
+    A, Ay, Az, Ayy, Azz, Ayz = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    start = 0
+    for count in counts:
+        end = start+count
+        yt, zt = [], []
+        for i in range(start, end):
+            if r[i] == 0.0:
+                yt.append(y[i])
+                zt.append(z[i])
+                continue
+            a = i-1 if i > start else end-1
+            c = i+1 if i < end-1 else start
+            yd, zd, ye, ze, seg = fillet_segment(y[a], z[a], y[i], z[i],
+                                                 y[c], z[c], r[i])
+            yt += [yd, ye]
+            zt += [zd, ze]
+            A += seg[0]
+            Ay += seg[1]
+            Az += seg[2]
+            Ayy += seg[3]
+            Azz += seg[4]
+            Ayz += seg[5]
+        ya, za = yt[-1], zt[-1]
+        for yb, zb in zip(yt, zt):
+            cr = ya*zb-za*yb
+            A += cr/2
+            Ay += cr*(ya+yb)/6
+            Az += cr*(za+zb)/6
+            Ayy += cr*(ya**2+ya*yb+yb**2)/12
+            Azz += cr*(za**2+za*zb+zb**2)/12
+            Ayz += cr*(ya*zb+2*ya*za+2*yb*zb+yb*za)/24
+            ya, za = yb, zb
+        start = end
+    return A, Ay, Az, Ayy, Azz, Ayz
@@ -2,6 +2,9 @@ from math import degrees
 from py2md.classes import MDHeading, MDTable
 from .generalsection import GeneralSection
 from ..results.sectionresult import SectionResult
+from ..results.batchresult import BatchResult
+from ..results.loadresponse import LoadResponse
+from .sectionproperties import StiffnessProperties, stiffness_from_moments
 from .. import config
 class MaterialSection(GeneralSection):
     material = None
@@ -17,7 +20,8 @@ class MaterialSection(GeneralSection):
     _EIyp = None
     _EIzp = None
     def __init__(self, section, material):
-        super().__init__(section.y, section.z, section.r, label=section.label)
+        super().__init__(section.y, section.z, section.r, label=section.label,
+                         holes=section.holes)
         for k in section.__dict__:
             self.__dict__[k] = section.__dict__[k]
         self.material = material
@@ -76,10 +80,36 @@ class MaterialSection(GeneralSection):
         if self._EIzp is None:
             self._EIzp = self.material.E*self.Izp
         return self._EIzp
+    def compute_stiffness(self):
+        if self._A is None:
+            self.calculate_moments()
+        E = self.material.E
+        stiff = stiffness_from_moments(E*self._A, E*self._Ay, E*self._Az,
+                                       E*self._Ayy, E*self._Azz, E*self._Ayz)
+        self.set_stiffness(stiff)
+        return stiff
+    def set_stiffness(self, stiff: StiffnessProperties):
+        self._EA = stiff.EA
+        self._EAy = stiff.EAy
+        self._EAz = stiff.EAz
+        self._EAyy = stiff.EAyy
+        self._EAzz = stiff.EAzz
+        self._EAyz = stiff.EAyz
+        self._EIyy = stiff.EIyy
+        self._EIzz = stiff.EIzz
+        self._EIyz = stiff.EIyz
+        self._EIyp = stiff.EIyp
+        self._EIzp = stiff.EIzp
     def apply_load(self, loadcase, lctype, Fx, My, Mz):
         sectresult = SectionResult(self)
         sectresult.set_load(loadcase, lctype, Fx, My, Mz)
         return sectresult
+    def apply_loads(self, loadcases: list, loads, limit: bool=False, critical: bool=False):
+        batchresult = BatchResult(self, critical=critical)
+        batchresult.set_loads(loadcases, loads, limit=limit)
+        return batchresult
+    def load_response(self, critical: bool=False):
+        return LoadResponse(self, critical=critical)
     def __repr__(self):
         if self.label is None:
             outstr = '<MaterialSection>'
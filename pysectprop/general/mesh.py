@@ -0,0 +1,168 @@
+from math import acos, atan2, ceil, cos, sin
+from typing import NamedTuple
+from numpy import arange, asarray, concatenate, cumsum, errstate, inf, int32, int64, isin, maximum, meshgrid, minimum, ndarray, roll, searchsorted, sort, sqrt, where, zeros
+from .arc import Arc
+from .polygon import polygon_moments
+from .propertycache import PropertyCache
+from .. import config
+
+class SectionMesh(NamedTuple):
+    nodes: ndarray
+    elems: ndarray
+    @property
+    def numnode(self):
+        return self.nodes.shape[0]
+    @property
+    def numelem(self):
+        return self.elems.shape[0]
+    def areas(self):
+        y = self.nodes[:, 0][self.elems]
+        z = self.nodes[:, 1][self.elems]
+        return ((y[:, 1]-y[:, 0])*(z[:, 2]-z[:, 0])-(y[:, 2]-y[:, 0])*(z[:, 1]-z[:, 0]))/2
+
+mesh_cache = PropertyCache(config.meshcachesize)
+
+def contour_points(path: list, size: float, tol: float):
+    y, z = [], []
+    for obj in path:
+        if isinstance(obj, Arc):
+            yf, zf = obj.pntf.y, obj.pntf.z
+            rad = obj.radius
+            tha = atan2(obj.pnta.z-zf, obj.pnta.y-yf)
+            # Chord sag of each sub-arc stays within tol.
+            dth = 2*acos(max(1.0-tol/rad, -1.0))
+            num = max(ceil(abs(obj.ang)/dth), ceil(abs(obj.ang)*rad/size), 1)
+            for i in range(num):
+                th = tha+obj.ang*i/num
+                y.append(yf+rad*cos(th))
+                z.append(zf+rad*sin(th))
+        else:
+            num = max(ceil(obj.length/size), 1)
+            for i in range(num):
+                y.append(obj.pnta.y+(obj.pntb.y-obj.pnta.y)*i/num)
+                z.append(obj.pnta.z+(obj.pntb.z-obj.pnta.z)*i/num)
+    return y, z
+
+def inside_contours(pnts: ndarray, contours: list):
+    # Even-odd rule, so clockwise holes cut out of the outer contour.
+    from matplotlib.path import Path
+    inside = zeros(pnts.shape[0], dtype=bool)
+    for contour in contours:
+        inside ^= Path(contour).contains_points(pnts)
+    return inside
+
+def lattice_inside(gy: ndarray, gz: ndarray, contours: list):
+    # Even-odd rule along each lattice row of constant z, counting the
+    # contour crossings to the left of every point.
+    bnds = concatenate(contours)
+    ia, ib = contour_segments(contours)
+    ya, za, yb, zb = bnds[ia, 0], bnds[ia, 1], bnds[ib, 0], bnds[ib, 1]
+    zr = gz[:, 0:1]
+    cross = (za <= zr) != (zb <= zr)
+    with errstate(divide='ignore', invalid='ignore'):
+        yc = ya+(zr-za)*(yb-ya)/(zb-za)
+    yc = sort(where(cross, yc, inf), axis=1)
+    inside = zeros(gy.shape, dtype=bool)
+    for i in range(gy.shape[0]):
+        inside[i] = searchsorted(yc[i], gy[i]) % 2 == 1
+    return inside
+
+def contour_segments(contours: list):
+    ia, ib = [], []
+    start = 0
+    for contour in contours:
+        num = contour.shape[0]
+        ind = arange(start, start+num)
+        ia.append(ind)
+        ib.append(roll(ind, -1))
+        start += num
+    return concatenate(ia), concatenate(ib)
+
+def edge_keys(ia: ndarray, ib: ndarray, num: int):
+    return minimum(ia, ib).astype(int64)*num+maximum(ia, ib)
+
+def mesh_paths(paths: list, size: float, tol: float, maxiter: int=64):
+    from scipy.spatial import Delaunay, cKDTree
+    contours = []
+    for path in paths:
+        y, z = contour_points(path, size, tol)
+        contours.append(asarray([y, z]).transpose())
+    bnds = concatenate(contours)
+    # Interior nodes on a triangular lattice, kept clear of the boundary.
+    ymin, zmin = bnds.min(axis=0)
+    ymax, zmax = bnds.max(axis=0)
+    dz = size*sqrt(3.0)/2
+    gy, gz = meshgrid(arange(ymin, ymax+size, size), arange(zmin, zmax+dz, dz))
+    gy[1::2, :] += size/2
+    grid = concatenate((gy.reshape(-1, 1), gz.reshape(-1, 1)), axis=1)
+    grid = grid[lattice_inside(gy, gz, contours).ravel()]
+    if grid.shape[0] > 0:
+        dist, _ = cKDTree(bnds).query(grid)
+        grid = grid[dist > size/2]
+    # Contour segments missing from the triangulation are split at their
+    # midpoints until every segment is a mesh edge, so no element can
+    # bridge a gap in the section.
+    ia, ib = contour_segments(contours)
+    for _ in range(maxiter):
+        nodes = concatenate((bnds, grid))
+        elems = Delaunay(nodes).simplices.astype(int32)
+        num = nodes.shape[0]
+        edges = edge_keys(elems, roll(elems, -1, axis=1), num).ravel()
+        miss = ~isin(edge_keys(ia, ib, num), edges)
+        if not miss.any():
+            break
+        numb = bnds.shape[0]
+        newind = arange(numb, numb+int(miss.sum()))
+        bnds = concatenate((bnds, (bnds[ia[miss]]+bnds[ib[miss]])/2))
+        ia, ib = concatenate((ia[~miss], ia[miss], newind)), concatenate((ib[~miss], newind, ib[miss]))
+    # Discard triangles outside the section or collapsed along straight edges.
+    cent = nodes[elems].mean(axis=1)
+    mesh = SectionMesh(nodes, elems)
+    area = mesh.areas()
+    keep = inside_contours(cent, contours) & (abs(area) > 1e-9*size**2)
+    elems = elems[keep]
+    flip = area[keep] < 0.0
+    elems[flip] = elems[flip][:, [0, 2, 1]]
+    used = zeros(nodes.shape[0], dtype=bool)
+    used[elems] = True
+    renum = cumsum(used)-1
+    mesh = SectionMesh(nodes[used], renum[elems].astype(int32))
+    # The mesh must cover the discretised outline exactly.
+    outline = sum(polygon_moments(contour[:, 0], contour[:, 1])[0] for contour in contours)
+    if abs(mesh.areas().sum()-outline) > 1e-6*abs(outline):
+        raise ValueError('Section mesh does not conform to the section outline.')
+    return mesh
+
+def path_lengths(path: list):
+    # Total and arc only lengths of a section path.
+    total, arcs = 0.0, 0.0
+    for obj in path:
+        if isinstance(obj, Arc):
+            arcs += abs(obj.ang)*obj.radius
+        else:
+            total += obj.length
+    return total+arcs, arcs
+
+def mesh_size(section, size: float=None, tol: float=None):
+    if size is None:
+        # Thin walls are resolved by about eight elements through the thickness.
+        perim, _ = path_lengths(section.path)
+        size = float(min(sqrt(abs(section.A))/10, abs(section.A)/perim/4))
+    if tol is None:
+        tol = size/10
+    return size, tol
+
+def section_mesh(section, size: float=None, tol: float=None):
+    size, tol = mesh_size(section, size=size, tol=tol)
+    key = f'{section.fingerprint():s}:{size!r}:{tol!r}'
+    mesh = mesh_cache.get(key)
+    if mesh is None:
+        if section._path is None:
+            section.generate_path()
+        mesh = mesh_paths(section._paths, size, tol)
+        # Chords of the fillet arcs may only differ from the section by their sag.
+        _, arcs = path_lengths(section._path)
+        if abs(mesh.areas().sum()-section.A) > tol*arcs+1e-6*abs(section.A):
+            raise ValueError('Section mesh area does not match the section area.')
+        mesh_cache.put(key, mesh)
+    return mesh
@@ -0,0 +1,46 @@
+from numpy import arange, asarray, cumsum, repeat
+
+def cyclic_index(num: int, shift: int=1):
+    return (arange(num)+shift) % num
+
+def contour_index(counts: list, shift: int=1):
+    # Cyclic neighbours within each of several concatenated contours.
+    counts = asarray(counts, dtype=int)
+    start = repeat(cumsum(counts)-counts, counts)
+    size = repeat(counts, counts)
+    return start+(arange(counts.sum())-start+shift) % size
+
+def polygon_moments(y, z, nxt=None):
+    y = asarray(y, dtype=float)
+    z = asarray(z, dtype=float)
+    if nxt is None:
+        nxt = cyclic_index(y.shape[-1])
+    yb = y.take(nxt, axis=-1)
+    zb = z.take(nxt, axis=-1)
+    cr = y*zb-z*yb
+    A = cr.sum(axis=-1)/2
+    Ay = (cr*(y+yb)).sum(axis=-1)/6
+    Az = (cr*(z+zb)).sum(axis=-1)/6
+    Ayy = (cr*(y**2+y*yb+yb**2)).sum(axis=-1)/12
+    Azz = (cr*(z**2+z*zb+zb**2)).sum(axis=-1)/12
+    Ayz = (cr*(y*zb+2*y*z+2*yb*zb+yb*z)).sum(axis=-1)/24
+    return A, Ay, Az, Ayy, Azz, Ayz
+
+def convex_hull_index(y: list, z: list):
+    # Monotone chain, returns counter-clockwise vertex indices.
+    order = sorted(range(len(y)), key=lambda i: (y[i], z[i]))
+    if len(order) < 3:
+        return order
+    def cross(o: int, a: int, b: int):
+        return (y[a]-y[o])*(z[b]-z[o])-(z[a]-z[o])*(y[b]-y[o])
+    lower = []
+    for i in order:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], i) <= 0.0:
+            lower.pop()
+        lower.append(i)
+    upper = []
+    for i in reversed(order):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], i) <= 0.0:
+            upper.pop()
+        upper.append(i)
+    return lower[:-1]+upper[:-1]
@@ -0,0 +1,68 @@
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import NamedTuple
+from .. import config
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+class PropertyCache(object):
+    maxsize: int = None
+    hits: int = None
+    misses: int = None
+    records: OrderedDict = None
+    def __init__(self, maxsize: int=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.records = OrderedDict()
+    @property
+    def enabled(self):
+        return self.maxsize > 0
+    def get(self, key: str):
+        record = self.records.get(key)
+        if record is None:
+            self.misses += 1
+        else:
+            self.records.move_to_end(key)
+            self.hits += 1
+        return record
+    def put(self, key: str, record):
+        if self.maxsize <= 0:
+            return
+        self.records[key] = record
+        self.records.move_to_end(key)
+        while len(self.records) > self.maxsize:
+            self.records.popitem(last=False)
+    def resize(self, maxsize: int):
+        self.maxsize = maxsize
+        while len(self.records) > max(maxsize, 0):
+            self.records.popitem(last=False)
+    def clear(self):
+        self.records.clear()
+        self.hits = 0
+        self.misses = 0
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.records))
+    def __len__(self):
+        return len(self.records)
+    def __contains__(self, key: str):
+        return key in self.records
+    def __repr__(self):
+        info = self.info()
+        return f'<PropertyCache hits={info.hits:d} misses={info.misses:d} size={info.currsize:d}/{info.maxsize:d}>'
+
+def fingerprint(kind: str, *values: list):
+    chunks = [kind.encode()]
+    for value in values:
+        # Adding 0.0 maps -0.0 to 0.0 so equal geometry hashes equally.
+        data = array('d', [float(v)+0.0 for v in value])
+        chunks.append(len(data).to_bytes(4, 'little'))
+        chunks.append(data.tobytes())
+    return blake2b(b''.join(chunks), digest_size=16).hexdigest()
+
+property_cache = PropertyCache(config.cachesize)
@@ -0,0 +1,177 @@
+from inspect import signature
+from json import dumps, loads
+from sqlite3 import connect
+from typing import NamedTuple
+from .generalsection import GeneralSection
+from .thinwalledsection import ThinWalledSection
+from .cripplingsection import CripplingSection
+from .propertycache import PropertyCache, fingerprint, property_cache
+from .sectionproperties import SectionProperties
+from .. import __version__
+
+# Bump whenever the stored columns or the property and crippling kernels
+# change, so records computed by older code are discarded.
+schemaversion = 1
+
+fields = SectionProperties._fields
+columns = ('A', 'Ay', 'Az', 'cy', 'cz', 'Ayy', 'Azz', 'Ayz',
+           'Iyy', 'Izz', 'Iyz', 'thp', 'Iyp', 'Izp')
+
+class StoreRecord(NamedTuple):
+    key: str
+    fingerprint: str
+    kind: str
+    builder: str
+    params: dict
+    props: SectionProperties
+    crippling: dict
+
+class PropertyStore(object):
+    filepath: str = None
+    version: str = None
+    schema: int = None
+    connection = None
+    def __init__(self, filepath: str=':memory:', version: str=__version__,
+                 schema: int=schemaversion):
+        self.filepath = filepath
+        self.version = version
+        self.schema = schema
+        self.connection = connect(filepath)
+        self.create_tables()
+        self.check_version()
+    def create_tables(self):
+        propcols = ', '.join(f'{col:s} REAL' for col in columns)
+        with self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS meta '
+                                    '(name TEXT PRIMARY KEY, value TEXT)')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS sections '
+                                    '(key TEXT PRIMARY KEY, fingerprint TEXT, '
+                                    'kind TEXT, builder TEXT, params TEXT, '
+                                    f'{propcols:s}, crippling TEXT)')
+    def check_version(self):
+        cur = self.connection.execute("SELECT name, value FROM meta")
+        meta = dict(cur.fetchall())
+        stamp = {'version': self.version, 'schema': str(self.schema)}
+        if any(meta.get(name) != value for name, value in stamp.items()):
+            if 'version' in meta:
+                old = meta['version']
+                oldschema = meta.get('schema', '0')
+                print(f'Property store version {old:s} (schema {oldschema:s}) is stale, clearing entries.')
+            with self.connection:
+                self.connection.execute('DROP TABLE IF EXISTS sections')
+            self.create_tables()
+            with self.connection:
+                for name, value in stamp.items():
+                    self.connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                                            (name, value))
+    def save(self, section):
+        self.save_many([section])
+        return record_key(section)
+    def save_many(self, sections: list):
+        rows = [record_row(section) for section in sections]
+        marks = ', '.join('?'*(len(columns)+6))
+        with self.connection:
+            self.connection.executemany(f'INSERT OR REPLACE INTO sections VALUES ({marks:s})', rows)
+        return len(rows)
+    def load(self, key: str):
+        cur = self.connection.execute('SELECT * FROM sections WHERE key = ?', (key, ))
+        row = cur.fetchone()
+        if row is None:
+            return None
+        return record_from_row(row)
+    def fetch(self, section):
+        record = self.load(record_key(section))
+        if record is None:
+            return None
+        section.set_properties(record.props)
+        return record
+    def load_all(self, kind: str=None, builder: str=None):
+        query = 'SELECT * FROM sections'
+        conds = []
+        args = []
+        if kind is not None:
+            conds.append('kind = ?')
+            args.append(kind)
+        if builder is not None:
+            conds.append('builder = ?')
+            args.append(builder)
+        if len(conds) > 0:
+            query += ' WHERE '+' AND '.join(conds)
+        cur = self.connection.execute(query, args)
+        return [record_from_row(row) for row in cur.fetchall()]
+    def preload(self, cache: PropertyCache=property_cache):
+        records = self.load_all()
+        for record in records:
+            cache.put(record.fingerprint, record.props)
+        return len(records)
+    def clear(self):
+        with self.connection:
+            self.connection.execute('DELETE FROM sections')
+    def close(self):
+        self.connection.close()
+    def __len__(self):
+        cur = self.connection.execute('SELECT COUNT(*) FROM sections')
+        return cur.fetchone()[0]
+    def __enter__(self):
+        return self
+    def __exit__(self, *args):
+        self.close()
+    def __repr__(self):
+        return f'<PropertyStore {self.filepath:s}>'
+
+def section_kind(section):
+    if isinstance(section, CripplingSection):
+        return 'crippling'
+    elif isinstance(section, ThinWalledSection):
+        return 'thinwalled'
+    elif isinstance(section, GeneralSection):
+        return 'general'
+    else:
+        raise TypeError(f'Cannot store section of type {type(section).__name__:s}.')
+
+def section_parameters(section):
+    params = {}
+    for name in signature(type(section).__init__).parameters:
+        if name in ('self', 'label'):
+            continue
+        value = getattr(section, name, None)
+        if isinstance(value, (int, float, str)):
+            params[name] = value
+    return params
+
+def crippling_parameters(section):
+    material = section.material
+    return {'Ec': material.Ec, 'Fcy': material.Fcy,
+            'coef': section.coef, 'cnef': section.cnef}
+
+def record_key(section):
+    kind = section_kind(section)
+    if kind == 'crippling':
+        crip = crippling_parameters(section)
+        if section.edges is None:
+            return fingerprint(kind, section.y, section.z, section.t, crip.values())
+        edges = [ind for edge in section.edges for ind in edge]
+        return fingerprint(kind, section.y, section.z, section.t, edges, crip.values())
+    return section.fingerprint()
+
+def record_row(section):
+    kind = section_kind(section)
+    props = section.compute()
+    if kind == 'crippling':
+        crippling = crippling_parameters(section)
+        crippling['Fcc'] = section.Fcc
+        crippling['Pcc'] = section.Pcc
+        crippling = dumps(crippling)
+    else:
+        crippling = None
+    params = dumps(section_parameters(section))
+    return (record_key(section), section.fingerprint(), kind,
+            type(section).__name__, params, *props, crippling)
+
+def record_from_row(row: tuple):
+    key, fprint, kind, builder, params = row[:5]
+    props = SectionProperties(*row[5:5+len(fields)])
+    crippling = row[5+len(fields)]
+    if crippling is not None:
+        crippling = loads(crippling)
+    return StoreRecord(key, fprint, kind, builder, loads(params), props, crippling)
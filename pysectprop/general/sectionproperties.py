@@ -0,0 +1,107 @@
+from math import atan, cos, sin, pi
+from typing import NamedTuple
+from numpy import absolute, arctan, cos as npcos, errstate, sin as npsin, where
+
+class SectionProperties(NamedTuple):
+    A: float
+    Ay: float
+    Az: float
+    cy: float
+    cz: float
+    Ayy: float
+    Azz: float
+    Ayz: float
+    Iyy: float
+    Izz: float
+    Iyz: float
+    θp: float
+    Iyp: float
+    Izp: float
+
+class StiffnessProperties(NamedTuple):
+    EA: float
+    EAy: float
+    EAz: float
+    cy: float
+    cz: float
+    EAyy: float
+    EAzz: float
+    EAyz: float
+    EIyy: float
+    EIzz: float
+    EIyz: float
+    θp: float
+    EIyp: float
+    EIzp: float
+
+def principal_moments(Iyy: float, Izz: float, Iyz: float):
+    tol = 1e-12
+    if abs(2*Iyz) < tol:
+        θp = 0.0
+    elif abs(Izz-Iyy) < tol:
+        θp = pi/4
+    else:
+        θp = atan(2*Iyz/(Izz-Iyy))/2
+    c = cos(θp)
+    s = sin(θp)
+    Iyp = Iyy*c**2+Izz*s**2-2*Iyz*c*s
+    Izp = Iyy*s**2+Izz*c**2+2*Iyz*c*s
+    return θp, Iyp, Izp
+
+def derived_moments(A: float, Ay: float, Az: float,
+                    Ayy: float, Azz: float, Ayz: float):
+    cy = Ay/A
+    cz = Az/A
+    Iyy = Azz-A*cz**2
+    Izz = Ayy-A*cy**2
+    Iyz = Ayz-A*cy*cz
+    θp, Iyp, Izp = principal_moments(Iyy, Izz, Iyz)
+    return (A, Ay, Az, cy, cz, Ayy, Azz, Ayz, Iyy, Izz, Iyz, θp, Iyp, Izp)
+
+def principal_moments_array(Iyy, Izz, Iyz):
+    tol = 1e-12
+    dI = Izz-Iyy
+    with errstate(divide='ignore', invalid='ignore'):
+        θp = arctan(2*Iyz/dI)/2
+    θp = where(absolute(dI) < tol, pi/4, θp)
+    θp = where(absolute(2*Iyz) < tol, 0.0, θp)
+    c = npcos(θp)
+    s = npsin(θp)
+    Iyp = Iyy*c**2+Izz*s**2-2*Iyz*c*s
+    Izp = Iyy*s**2+Izz*c**2+2*Iyz*c*s
+    return θp, Iyp, Izp
+
+def derived_moments_array(A, Ay, Az, Ayy, Azz, Ayz):
+    with errstate(divide='ignore', invalid='ignore'):
+        cy = Ay/A
+        cz = Az/A
+    Iyy = Azz-A*cz**2
+    Izz = Ayy-A*cy**2
+    Iyz = Ayz-A*cy*cz
+    θp, Iyp, Izp = principal_moments_array(Iyy, Izz, Iyz)
+    return (A, Ay, Az, cy, cz, Ayy, Azz, Ayz, Iyy, Izz, Iyz, θp, Iyp, Izp)
+
+def properties_from_moments(A: float, Ay: float, Az: float,
+                            Ayy: float, Azz: float, Ayz: float):
+    return SectionProperties(*derived_moments(A, Ay, Az, Ayy, Azz, Ayz))
+
+def stiffness_from_moments(EA: float, EAy: float, EAz: float,
+                           EAyy: float, EAzz: float, EAyz: float):
+    return StiffnessProperties(*derived_moments(EA, EAy, EAz, EAyy, EAzz, EAyz))
+
+def transform_moments(A: float, Ay: float, Az: float,
+                      Ayy: float, Azz: float, Ayz: float,
+                      a: float, b: float, c: float, d: float,
+                      yt: float=0.0, zt: float=0.0):
+    # Moments after the rigid mapping y' = a*y+b*z+yt, z' = c*y+d*z+zt.
+    Ay1 = a*Ay+b*Az
+    Az1 = c*Ay+d*Az
+    Ayy1 = a**2*Ayy+2*a*b*Ayz+b**2*Azz
+    Azz1 = c**2*Ayy+2*c*d*Ayz+d**2*Azz
+    Ayz1 = a*c*Ayy+(a*d+b*c)*Ayz+b*d*Azz
+    Ayy2 = Ayy1+2*yt*Ay1+yt**2*A
+    Azz2 = Azz1+2*zt*Az1+zt**2*A
+    Ayz2 = Ayz1+yt*Az1+zt*Ay1+yt*zt*A
+    Ay2 = Ay1+yt*A
+    Az2 = Az1+zt*A
+    return A, Ay2, Az2, Ayy2, Azz2, Ayz2
@@ -1,15 +1,23 @@
+from collections import deque
 from math import pi, cos, sin, atan, degrees, atan2, radians
+from typing import NamedTuple
 from matplotlib.pyplot import figure
 from matplotlib.patches import Rectangle
+from numpy import arange, arctan2, asarray, bincount, concatenate, cumsum, degrees as npdegrees, ndarray, sqrt, zeros
 from py2md.classes import MDHeading, MDTable
+from .propertycache import fingerprint, property_cache
+from .sectionproperties import SectionProperties, properties_from_moments, transform_moments
 from .. import config
 
 class ThinWalledSection(object):
     y = None
     z = None
     t = None
+    edges = None
     label: str = None
-    segs = None
+    _segs = None
+    _walls = None
+    _torsion = None
     _A = None
     _Ay = None
     _Az = None
@@ -24,61 +32,143 @@ class ThinWalledSection(object):
     _θp = None
     _Iyp = None
     _Izp = None
-    def __init__(self, y: list, z: list, t: list, label: str=None):
+    def __init__(self, y: list, z: list, t: list, label: str=None, edges: list=None):
         lent = len(t)
         leny = len(y)
         lenz = len(z)
         if leny != lenz:
             print('The length of y does not equal the length of z.')
             return
-        if lent != leny and lent != leny-1:
-            print('The length of thickness is not consistant with the geometry.')
-            return
+        if edges is None:
+            if lent != leny and lent != leny-1:
+                print('The length of thickness is not consistant with the geometry.')
+                return
+        else:
+            # Walls join arbitrary pairs of points, each with its own thickness.
+            edges = [(int(ia), int(ib)) for ia, ib in edges]
+            if lent != len(edges):
+                print('The length of thickness is not consistant with the edges.')
+                return
+            for ia, ib in edges:
+                if ia == ib or min(ia, ib) < 0 or max(ia, ib) >= leny:
+                    print('The edges do not reference valid points.')
+                    return
+            self.edges = edges
         self.y = y
         self.z = z
         self.t = t
         self.label = label
-        self.generate_segments()
     def check_area(self, display=True):
-        self._A = None
-        if self.A < 0.0:
+        self.calculate_moments()
+        if self._A < 0.0:
             if display:
                 print('Reversed coordinates.')
             self.y.reverse()
             self.z.reverse()
             self.t.reverse()
-            self.generate_segments()
-        self._A = None
-    def generate_segments(self):
-        lent = len(self.t)
-        lenp = len(self.y)
-        self.segs = []
-        for i in range(lent-1):
-            ya = self.y[i]
-            za = self.z[i]
-            yb = self.y[i+1]
-            zb = self.z[i+1]
-            ts = self.t[i]
-            ws = WallSegment(ya, za, yb, zb, ts)
-            self.segs.append(ws)
-        if lenp > lent:
-            ya = self.y[-2]
-            za = self.z[-2]
-            yb = self.y[-1]
-            zb = self.z[-1]
-            ts = self.t[-1]
+            self._segs = None
+            self._walls = None
+            self._torsion = None
+            self.calculate_moments()
+    def generate_walls(self):
+        if self.edges is None:
+            self._walls = wall_arrays(self.y, self.z, self.t)
         else:
-            ya = self.y[-1]
-            za = self.z[-1]
-            yb = self.y[0]
-            zb = self.z[0]
-            ts = self.t[-1]
-        ws = WallSegment(ya, za, yb, zb, ts)
-        self.segs.append(ws)
-        if lenp != lent:
-            self.segs[0].set_free_at_a(True)
-            self.segs[-1].set_free_at_b(True)
+            self._walls = graph_arrays(self.y, self.z, self.edges, self.t)
+    @property
+    def walls(self):
+        if self._walls is None:
+            self.generate_walls()
+        return self._walls
+    def generate_segments(self):
+        walls = self.walls
+        segs = []
+        for i in range(walls.ts.size):
+            ws = WallSegment(float(walls.ya[i]), float(walls.za[i]),
+                             float(walls.yb[i]), float(walls.zb[i]),
+                             float(walls.ts[i]))
+            ws.set_free_at_a(bool(walls.fa[i]))
+            ws.set_free_at_b(bool(walls.fb[i]))
+            segs.append(ws)
+        self._segs = segs
+    @property
+    def segs(self):
+        if self._segs is None:
+            self.generate_segments()
+        return self._segs
+    @property
+    def closed(self):
+        if self.edges is None:
+            return len(self.t) == len(self.y)
+        return not (self.walls.fa.any() or self.walls.fb.any())
+    def torsion(self):
+        if self._torsion is None:
+            if self.edges is None:
+                self._torsion = wall_torsion(self.walls, closed=self.closed)
+            else:
+                self._torsion = graph_torsion(self.walls, self.edges)
+        return self._torsion
+    def fingerprint(self):
+        if self.edges is None:
+            return fingerprint('thinwalled', self.y, self.z, self.t)
+        edges = [ind for edge in self.edges for ind in edge]
+        return fingerprint('thinwalledgraph', self.y, self.z, self.t, edges)
+    def calculate_moments(self):
+        key, props = None, None
+        if property_cache.enabled:
+            key = self.fingerprint()
+            props = property_cache.get(key)
+        if props is not None:
+            self.set_properties(props)
+            return
+        A, Ay, Az, Ayy, Azz, Ayz = wall_moments(self.walls)
+        props = properties_from_moments(float(A), float(Ay), float(Az),
+                                        float(Ayy), float(Azz), float(Ayz))
+        if key is not None:
+            property_cache.put(key, props)
+        self.set_properties(props)
+    def set_moments(self, A: float, Ay: float, Az: float,
+                    Ayy: float, Azz: float, Ayz: float):
+        self._A = A
+        self._Ay = Ay
+        self._Az = Az
+        self._cy = None
+        self._cz = None
+        self._Ayy = Ayy
+        self._Azz = Azz
+        self._Ayz = Ayz
+        self._Iyy = None
+        self._Izz = None
+        self._Iyz = None
+        self._θp = None
+        self._Iyp = None
+        self._Izp = None
+    def compute(self):
+        if self._A is None:
+            self.calculate_moments()
+        props = properties_from_moments(self._A, self._Ay, self._Az,
+                                        self._Ayy, self._Azz, self._Ayz)
+        self.set_properties(props)
+        return props
+    def set_properties(self, props: SectionProperties):
+        self._A = props.A
+        self._Ay = props.Ay
+        self._Az = props.Az
+        self._cy = props.cy
+        self._cz = props.cz
+        self._Ayy = props.Ayy
+        self._Azz = props.Azz
+        self._Ayz = props.Ayz
+        self._Iyy = props.Iyy
+        self._Izz = props.Izz
+        self._Iyz = props.Iyz
+        self._θp = props.θp
+        self._Iyp = props.Iyp
+        self._Izp = props.Izp
     def reset(self):
+        self._segs = None
+        self._walls = None
+        self._torsion = None
         self._A = None
         self._Ay = None
         self._Az = None
@@ -94,46 +184,46 @@ class ThinWalledSection(object):
         self._Iyp = None
         self._Izp = None
         self.check_area(display=False)
-    def mirror_y(self):
-        z = [-zi for zi in self.z]
+    def transform(self, a: float, b: float, c: float, d: float,
+                  yt: float=0.0, zt: float=0.0):
+        if self._A is None:
+            self.calculate_moments()
+        moments = transform_moments(self._A, self._Ay, self._Az,
+                                    self._Ayy, self._Azz, self._Ayz,
+                                    a, b, c, d, yt, zt)
+        y = [a*yi+b*zi+yt for yi, zi in zip(self.y, self.z)]
+        z = [c*yi+d*zi+zt for yi, zi in zip(self.y, self.z)]
+        self.y = y
         self.z = z
-        self.reset()
-        self.generate_segments()
-        self.check_area(display=False)
+        self._segs = None
+        self._walls = None
+        self._torsion = None
+        self.set_moments(*moments)
+    def mirror_y(self):
+        self.transform(1.0, 0.0, 0.0, -1.0)
     def mirror_z(self):
-        y = [-yi for yi in self.y]
-        self.y = y
-        self.reset()
-        self.generate_segments()
-        self.check_area(display=False)
+        self.transform(-1.0, 0.0, 0.0, 1.0)
     def translate(self, yt: float, zt: float):
-        y = [-yi+yt for yi in self.y]
-        self.y = y
-        z = [-zi+zt for zi in self.z]
-        self.z = z
-        self.reset()
-        self.generate_segments()
-        self.check_area(display=False)
+        self.transform(1.0, 0.0, 0.0, 1.0, yt, zt)
+    def rotate(self, θr: float):
+        thrad = radians(θr)
+        costh = cos(thrad)
+        sinth = sin(thrad)
+        self.transform(costh, -sinth, sinth, costh)
     @property
     def A(self):
         if self._A is None:
-            self._A = 0.0
-            for seg in self.segs:
-                self._A += seg.A
+            self.calculate_moments()
         return self._A
     @property
     def Ay(self):
         if self._Ay is None:
-            self._Ay = 0.0
-            for seg in self.segs:
-                self._Ay += seg.Ay
+            self.calculate_moments()
         return self._Ay
     @property
     def Az(self):
         if self._Az is None:
-            self._Az = 0.0
-            for seg in self.segs:
-                self._Az += seg.Az
+            self.calculate_moments()
         return self._Az
     @property
     def cy(self):
@@ -148,23 +238,17 @@ class ThinWalledSection(object):
     @property
     def Ayy(self):
         if self._Ayy is None:
-            self._Ayy = 0.0
-            for seg in self.segs:
-                self._Ayy += seg.Ayy
+            self.calculate_moments()
         return self._Ayy
     @property
     def Azz(self):
         if self._Azz is None:
-            self._Azz = 0.0
-            for seg in self.segs:
-                self._Azz += seg.Azz
+            self.calculate_moments()
         return self._Azz
     @property
     def Ayz(self):
         if self._Ayz is None:
-            self._Ayz = 0.0
-            for seg in self.segs:
-                self._Ayz += seg.Ayz
+            self.calculate_moments()
         return self._Ayz
     @property
     def Iyy(self):
@@ -266,6 +350,174 @@ class ThinWalledSection(object):
     def _repr_markdown_(self):
         return self.__str__()
 
+class WallArrays(NamedTuple):
+    ya: ndarray
+    za: ndarray
+    yb: ndarray
+    zb: ndarray
+    ts: ndarray
+    ls: ndarray
+    th: ndarray
+    fa: ndarray
+    fb: ndarray
+
+def wall_arrays(y: list, z: list, t: list):
+    y = asarray(y, dtype=float)
+    z = asarray(z, dtype=float)
+    ts = asarray(t, dtype=float)
+    numt = ts.size
+    numy = y.size
+    ia = arange(numt)
+    ib = (ia+1) % numy
+    ya, za, yb, zb = y[ia], z[ia], y[ib], z[ib]
+    dy = yb-ya
+    dz = zb-za
+    ls = sqrt(dy**2+dz**2)
+    th = npdegrees(arctan2(dz, dy))
+    fa = zeros(numt, dtype=bool)
+    fb = zeros(numt, dtype=bool)
+    if numy != numt:
+        fa[0] = True
+        fb[-1] = True
+    return WallArrays(ya, za, yb, zb, ts, ls, th, fa, fb)
+
+def graph_arrays(y: list, z: list, edges: list, t: list):
+    y = asarray(y, dtype=float)
+    z = asarray(z, dtype=float)
+    ts = asarray(t, dtype=float)
+    ia = asarray([edge[0] for edge in edges], dtype=int)
+    ib = asarray([edge[1] for edge in edges], dtype=int)
+    ya, za, yb, zb = y[ia], z[ia], y[ib], z[ib]
+    dy = yb-ya
+    dz = zb-za
+    ls = sqrt(dy**2+dz**2)
+    th = npdegrees(arctan2(dz, dy))
+    # Points joined to a single wall are free edges.
+    degree = bincount(concatenate((ia, ib)), minlength=y.size)
+    fa = degree[ia] == 1
+    fb = degree[ib] == 1
+    return WallArrays(ya, za, yb, zb, ts, ls, th, fa, fb)
+
+def wall_moments(walls: WallArrays):
+    ya, za, yb, zb = walls.ya, walls.za, walls.yb, walls.zb
+    As = walls.ts*walls.ls
+    A = As.sum()
+    Ay = (As*(yb+ya)).sum()/2
+    Az = (As*(zb+za)).sum()/2
+    Ayy = (As*(yb**2+yb*ya+ya**2)).sum()/3
+    Azz = (As*(zb**2+zb*za+za**2)).sum()/3
+    Ayz = (As*(zb*yb+za*ya+(zb*ya+za*yb)/2)).sum()/3
+    return A, Ay, Az, Ayy, Azz, Ayz
+
+class WallTorsion(NamedTuple):
+    J: float
+    ys: float
+    zs: float
+    Cw: float
+
+def sectorial_torsion(walls: WallArrays, J: float, wa: ndarray, wb: ndarray):
+    # Sectorial coordinates are taken about the origin, so the shear centre
+    # from the centroidal products comes out in section coordinates.
+    A, Ay, Az, Ayy, Azz, Ayz = wall_moments(walls)
+    cy, cz = Ay/A, Az/A
+    ya, za = walls.ya-cy, walls.za-cz
+    yb, zb = walls.yb-cy, walls.zb-cz
+    As = walls.ts*walls.ls
+    Iyy = Azz-A*cz**2
+    Izz = Ayy-A*cy**2
+    Iyz = Ayz-A*cy*cz
+    Iwy = (As*(2*wa*ya+wa*yb+wb*ya+2*wb*yb)).sum()/6
+    Iwz = (As*(2*wa*za+wa*zb+wb*za+2*wb*zb)).sum()/6
+    D = Iyy*Izz-Iyz**2
+    ys = (Izz*Iwz-Iyz*Iwy)/D
+    zs = (Iyz*Iwz-Iyy*Iwy)/D
+    # Warping constant from the sectorial coordinate about the shear centre.
+    wa = wa-ys*za+zs*ya
+    wb = wb-ys*zb+zs*yb
+    Iw = (As*(wa+wb)).sum()/2
+    Iww = (As*(wa**2+wa*wb+wb**2)).sum()/3
+    Cw = Iww-Iw**2/A
+    return WallTorsion(float(J), float(ys), float(zs), float(Cw))
+
+def wall_torsion(walls: WallArrays, closed: bool=False):
+    # Segments form a chain from the first point, closing on it when closed.
+    dw = walls.ya*walls.zb-walls.yb*walls.za
+    if closed:
+        # Bredt shear flow term is removed around the single closed cell.
+        lt = walls.ls/walls.ts
+        J = dw.sum()**2/lt.sum()
+        dw = dw-dw.sum()*lt/lt.sum()
+    else:
+        J = (walls.ls*walls.ts**3).sum()/3
+    wb = cumsum(dw)
+    wa = wb-dw
+    return sectorial_torsion(walls, J, wa, wb)
+
+def graph_torsion(walls: WallArrays, edges: list):
+    # Walk a spanning tree of the walls from the first edge, at most one
+    # remaining wall may close a single cell.
+    links = {}
+    for i, (ia, ib) in enumerate(edges):
+        links.setdefault(ia, []).append((i, ib))
+        links.setdefault(ib, []).append((i, ia))
+    root = edges[0][0]
+    parent = {root: None}
+    order = [root]
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        for i, other in links[node]:
+            if other not in parent:
+                parent[other] = (i, node)
+                order.append(other)
+                queue.append(other)
+    if len(parent) != len(links):
+        print('Torsion requires the walls to be connected.')
+        return None
+    tree = set(val[0] for val in parent.values() if val is not None)
+    loose = [i for i in range(len(edges)) if i not in tree]
+    if len(loose) > 1:
+        print('Torsion is limited to open sections or a single closed cell.')
+        return None
+    dw = walls.ya*walls.zb-walls.yb*walls.za
+    lt = walls.ls/walls.ts
+    sign = zeros(len(edges))
+    if len(loose) == 1:
+        # Orient the cell from the closing wall back through the tree.
+        i = loose[0]
+        ia, ib = edges[i]
+        sign[i] = 1.0
+        patha, pathb = [ia], [ib]
+        while parent[patha[-1]] is not None:
+            patha.append(parent[patha[-1]][1])
+        while parent[pathb[-1]] is not None:
+            pathb.append(parent[pathb[-1]][1])
+        while len(patha) > 1 and len(pathb) > 1 and patha[-2] == pathb[-2]:
+            patha.pop()
+            pathb.pop()
+        for node in pathb[:-1]:
+            j = parent[node][0]
+            sign[j] = 1.0 if edges[j][0] == node else -1.0
+        for node in patha[:-1]:
+            j = parent[node][0]
+            sign[j] = 1.0 if edges[j][1] == node else -1.0
+    cell = sign != 0.0
+    J = (walls.ls[~cell]*walls.ts[~cell]**3).sum()/3
+    if cell.any():
+        area2 = (sign*dw).sum()
+        J += area2**2/lt[cell].sum()
+        dw = dw-sign*area2*lt/lt[cell].sum()
+    w = {root: 0.0}
+    for node in order[1:]:
+        i, prev = parent[node]
+        if edges[i][0] == prev:
+            w[node] = w[prev]+dw[i]
+        else:
+            w[node] = w[prev]-dw[i]
+    wa = asarray([w[edge[0]] for edge in edges])
+    wb = asarray([w[edge[1]] for edge in edges])
+    return sectorial_torsion(walls, J, wa, wb)
+
 class WallSegment(object):
     ya = None
     za = None
@@ -356,7 +608,7 @@ class WallSegment(object):
         thrad = radians(self.th)
         yo = self.ya+self.ts/2*sin(thrad)
         zo = self.za-self.ts/2*cos(thrad)
-        rect = Rectangle((yo, zo), self.ls, self.ts, self.th)
+        rect = Rectangle((yo, zo), self.ls, self.ts, angle=self.th)
         return rect
     def __repr__(self):
         return '<WallSegment>'
@@ -0,0 +1,102 @@
+from typing import NamedTuple
+from numpy import asarray, bincount, einsum, repeat, tile, zeros
+from .mesh import SectionMesh, mesh_size, section_mesh
+from .propertycache import property_cache
+
+class TorsionProperties(NamedTuple):
+    J: float
+    ys: float
+    zs: float
+    Cw: float
+    Asy: float
+    Asz: float
+
+# Six point Gauss rule on a triangle, exact to fourth order.
+gauss_coords = asarray([
+    [0.445948490915965, 0.445948490915965, 0.108103018168070],
+    [0.445948490915965, 0.108103018168070, 0.445948490915965],
+    [0.108103018168070, 0.445948490915965, 0.445948490915965],
+    [0.091576213509771, 0.091576213509771, 0.816847572980459],
+    [0.091576213509771, 0.816847572980459, 0.091576213509771],
+    [0.816847572980459, 0.091576213509771, 0.091576213509771],
+])
+gauss_weights = asarray([0.223381589678011]*3+[0.109951743655322]*3)
+
+def mesh_torsion(mesh: SectionMesh, nu: float=0.0):
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.linalg import splu
+    elems = mesh.elems
+    numnode = mesh.numnode
+    area = mesh.areas()
+    # Work in centroidal coordinates.
+    ye = mesh.nodes[:, 0][elems]
+    ze = mesh.nodes[:, 1][elems]
+    A = area.sum()
+    cy = (area*ye.mean(axis=1)).sum()/A
+    cz = (area*ze.mean(axis=1)).sum()/A
+    ye = ye-cy
+    ze = ze-cz
+    # Constant shape function gradients of each linear triangle.
+    dNy = (ze[:, [1, 2, 0]]-ze[:, [2, 0, 1]])/(2*area[:, None])
+    dNz = (ye[:, [2, 0, 1]]-ye[:, [1, 2, 0]])/(2*area[:, None])
+    wa = area[:, None]*gauss_weights[None, :]
+    yg = ye@gauss_coords.transpose()
+    zg = ze@gauss_coords.transpose()
+    Iyy = (wa*zg**2).sum()
+    Izz = (wa*yg**2).sum()
+    Iyz = (wa*yg*zg).sum()
+    r = yg**2-zg**2
+    q = 2*yg*zg
+    d1 = Iyy*r-Iyz*q
+    d2 = Iyz*r+Iyy*q
+    h1 = -Iyz*r+Izz*q
+    h2 = -Izz*r-Iyz*q
+    # Element stiffness and load vectors for warping and the two shear functions.
+    Ke = (einsum('ei,ej->eij', dNy, dNy)+einsum('ei,ej->eij', dNz, dNz))*area[:, None, None]
+    ft = (dNy*zg.mean(axis=1)[:, None]-dNz*yg.mean(axis=1)[:, None])*area[:, None]
+    fpsi = nu/2*(dNy*(wa*d1).sum(axis=1)[:, None]+dNz*(wa*d2).sum(axis=1)[:, None])
+    fpsi += 2*(1+nu)*((wa*(Iyy*yg-Iyz*zg))@gauss_coords)
+    fphi = nu/2*(dNy*(wa*h1).sum(axis=1)[:, None]+dNz*(wa*h2).sum(axis=1)[:, None])
+    fphi += 2*(1+nu)*((wa*(Izz*zg-Iyz*yg))@gauss_coords)
+    rows = repeat(elems, 3, axis=1).ravel()
+    cols = tile(elems, (1, 3)).ravel()
+    K = coo_matrix((Ke.ravel(), (rows, cols)), shape=(numnode, numnode)).tocsc()
+    F = zeros((numnode, 3))
+    for i, fe in enumerate((ft, fpsi, fphi)):
+        F[:, i] = bincount(elems.ravel(), weights=fe.ravel(), minlength=numnode)
+    # The first node is pinned to remove the free constant, one factorisation
+    # serves all three load cases.
+    U = zeros((numnode, 3))
+    U[1:, :] = splu(K[1:, 1:]).solve(F[1:, :])
+    U -= U.mean(axis=0)
+    omega, psi, phi = U[:, 0], U[:, 1], U[:, 2]
+    ftv = F[:, 0]
+    J = Iyy+Izz-omega@ftv
+    Ds = 2*(1+nu)*(Iyy*Izz-Iyz**2)
+    rg = yg**2+zg**2
+    scy = (wa*(Izz*yg+Iyz*zg)*rg).sum()
+    scz = (wa*(Iyy*zg+Iyz*yg)*rg).sum()
+    ys = (nu/2*scy-ftv@phi)/Ds
+    zs = (nu/2*scz+ftv@psi)/Ds
+    # Warping function about the shear centre for the warping constant.
+    ws = omega[elems]-zs*ye+ys*ze
+    wg = ws@gauss_coords.transpose()
+    Cw = (wa*wg**2).sum()-(wa*wg).sum()**2/A
+    gpsiy = (psi[elems]*dNy).sum(axis=1)[:, None]-nu/2*d1
+    gpsiz = (psi[elems]*dNz).sum(axis=1)[:, None]-nu/2*d2
+    gphiy = (phi[elems]*dNy).sum(axis=1)[:, None]-nu/2*h1
+    gphiz = (phi[elems]*dNz).sum(axis=1)[:, None]-nu/2*h2
+    ky = (wa*(gpsiy**2+gpsiz**2)).sum()
+    kz = (wa*(gphiy**2+gphiz**2)).sum()
+    return TorsionProperties(float(J), float(ys+cy), float(zs+cz), float(Cw),
+                             float(Ds**2/ky), float(Ds**2/kz))
+
+def section_torsion(section, size: float=None, tol: float=None, nu: float=0.0):
+    size, tol = mesh_size(section, size=size, tol=tol)
+    key = f'torsion:{section.fingerprint():s}:{size!r}:{tol!r}:{nu!r}'
+    props = property_cache.get(key)
+    if props is None:
+        mesh = section_mesh(section, size=size, tol=tol)
+        props = mesh_torsion(mesh, nu=nu)
+        property_cache.put(key, props)
+    return props
@@ -1 +1,6 @@
-from .sectionresult import SectionResult
\ No newline at end of file
+from .sectionresult import SectionResult
+from .batchresult import BatchResult
+from .loadresponse import LoadResponse
+from .envelope import Envelope, envelope
+from .parallel import parallel_reserve_factors
+from .loadfactor import LoadFactors, load_factors
@@ -0,0 +1,119 @@
+from math import floor, isfinite
+from numpy import arange, asarray, atleast_2d
+from py2md.classes import MDHeading, MDTable
+from .sectionresult import SectionResult, material_allowables, reserve_factors, strain_coefficients
+from .. import config
+
+class BatchResult(object):
+    loadcases: list = None
+    limit: bool = None
+    totalsection = None
+    materialsection = None
+    critical: bool = None
+    index = None
+    loads = None
+    y = None
+    z = None
+    yna = None
+    zna = None
+    coef = None
+    eps = None
+    sigma = None
+    allowed = None
+    result = None
+    def __init__(self, materialsection, totalsection=None, critical: bool=False):
+        self.materialsection = materialsection
+        if totalsection is None:
+            self.totalsection = materialsection
+        else:
+            self.totalsection = totalsection
+        self.critical = critical
+        pnts = self.materialsection.pnts
+        if critical:
+            self.index = asarray(self.materialsection.hull, dtype=int)
+            pnts = [pnts[i] for i in self.index]
+        else:
+            self.index = arange(len(pnts))
+        self.y = asarray([pnt.y for pnt in pnts], dtype=float)
+        self.z = asarray([pnt.z for pnt in pnts], dtype=float)
+        self.yna = self.y-self.totalsection.cy
+        self.zna = self.z-self.totalsection.cz
+        self.coef = strain_coefficients(self.totalsection.EA, self.totalsection.EIyy,
+                                        self.totalsection.EIzz, self.totalsection.EIyz,
+                                        self.yna, self.zna)
+    def set_loads(self, loadcases: list, loads, limit: bool=False):
+        self.loads = atleast_2d(asarray(loads, dtype=float))
+        if loadcases is None:
+            loadcases = [f'{i+1:d}' for i in range(self.loads.shape[0])]
+        self.loadcases = list(loadcases)
+        self.limit = limit
+        tensall, compall = material_allowables(self.materialsection.material, limit)
+        self.eps = self.loads@self.coef
+        self.sigma = self.eps*self.materialsection.material.E
+        self.allowed, self.result = reserve_factors(self.sigma, tensall, compall)
+    @property
+    def Fx(self):
+        return self.loads[:, 0]
+    @property
+    def My(self):
+        return self.loads[:, 1]
+    @property
+    def Mz(self):
+        return self.loads[:, 2]
+    @property
+    def numcase(self):
+        return self.loads.shape[0]
+    def governing(self):
+        ind = self.result.argmin(axis=1)
+        return self.result[arange(self.numcase), ind], ind
+    def case_result(self, ind: int):
+        sectresult = SectionResult(self.materialsection, totalsection=self.totalsection)
+        sectresult.loadcase = self.loadcases[ind]
+        sectresult.limit = self.limit
+        sectresult.Fx, sectresult.My, sectresult.Mz = self.loads[ind].tolist()
+        sectresult.y = self.y
+        sectresult.z = self.z
+        sectresult.yna = self.yna
+        sectresult.zna = self.zna
+        sectresult.eps = self.eps[ind]
+        sectresult.sigma = self.sigma[ind]
+        sectresult.allowed = self.allowed[ind]
+        sectresult.result = self.result[ind]
+        return sectresult
+    def __str__(self):
+        lctyp = 'Ultimate'
+        if self.limit:
+            lctyp = 'Limit'
+        msl = self.materialsection.label
+        if msl is None:
+            msl = 'Section'
+        mdstr = ''
+        heading = MDHeading(f'Results of {msl:s} ({lctyp:s})', 3)
+        mdstr += str(heading)
+        table = MDTable()
+        table.add_column('Load Case', 's')
+        table.add_column(f'F<sub>x</sub> ({config.funit:s})', '.1f')
+        table.add_column(f'M<sub>y</sub> ({config.funit:s}.{config.lunit:s})', '.1f')
+        table.add_column(f'M<sub>z</sub> ({config.funit:s}.{config.lunit:s})', '.1f')
+        table.add_column(f'y ({config.lunit:s})', config.l1frm)
+        table.add_column(f'z ({config.lunit:s})', config.l1frm)
+        table.add_column(f'&sigma; ({config.sunit:s})', '.1f')
+        if config.msmode:
+            table.add_column('MS', '.2f')
+        else:
+            table.add_column('RF', '.2f')
+        result, ind = self.governing()
+        for i in range(self.numcase):
+            j = ind[i]
+            resi = float(result[i])
+            if isfinite(resi):
+                resi = floor(resi*100)/100
+            if config.msmode:
+                resi = resi-1.0
+            table.add_row([self.loadcases[i], self.loads[i, 0], self.loads[i, 1],
+                           self.loads[i, 2], self.y[j], self.z[j],
+                           self.sigma[i, j], resi])
+        mdstr += str(table)
+        return mdstr
+    def _repr_markdown_(self):
+        return self.__str__()
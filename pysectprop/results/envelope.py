@@ -0,0 +1,162 @@
+from csv import reader
+from math import floor, isfinite
+from numpy import arange, argpartition, argsort, asarray, atleast_2d, concatenate, empty, full, inf, load, maximum, minimum, ndarray
+from py2md.classes import MDHeading, MDTable
+from .loadresponse import LoadResponse
+from .. import config
+
+class Envelope(object):
+    response: LoadResponse = None
+    limit: bool = None
+    topk: int = None
+    numcase: int = None
+    sigma_min = None
+    sigma_max = None
+    result_min = None
+    top_ids = None
+    top_loads = None
+    top_results = None
+    top_points = None
+    def __init__(self, section, limit: bool=False, topk: int=10, critical: bool=False):
+        if isinstance(section, LoadResponse):
+            self.response = section
+        else:
+            self.response = section.load_response(critical=critical)
+        self.limit = limit
+        self.topk = topk
+        self.reset()
+    def reset(self):
+        num = self.response.numpnt
+        self.numcase = 0
+        self.sigma_min = full(num, inf)
+        self.sigma_max = full(num, -inf)
+        self.result_min = full(num, inf)
+        self.top_ids = empty(0, dtype=object)
+        self.top_loads = empty((0, 3))
+        self.top_results = empty(0)
+        self.top_points = empty(0, dtype=int)
+    def update(self, loads, ids=None):
+        loads = atleast_2d(asarray(loads, dtype=float))
+        num = loads.shape[0]
+        if num == 0:
+            return
+        if ids is None:
+            ids = arange(self.numcase, self.numcase+num)
+        ids = asarray(ids, dtype=object)
+        _, sigma, _, result = self.response.evaluate(loads, limit=self.limit)
+        self.sigma_min = minimum(self.sigma_min, sigma.min(axis=0))
+        self.sigma_max = maximum(self.sigma_max, sigma.max(axis=0))
+        self.result_min = minimum(self.result_min, result.min(axis=0))
+        pnt = result.argmin(axis=1)
+        res = result[arange(num), pnt]
+        # Merge this chunk's governing cases into the running top-k.
+        ids = concatenate((self.top_ids, ids))
+        loads = concatenate((self.top_loads, loads))
+        res = concatenate((self.top_results, res))
+        pnt = concatenate((self.top_points, pnt))
+        if res.size > self.topk:
+            keep = argpartition(res, self.topk-1)[:self.topk]
+        else:
+            keep = arange(res.size)
+        keep = keep[argsort(res[keep], kind='stable')]
+        self.top_ids = ids[keep]
+        self.top_loads = loads[keep]
+        self.top_results = res[keep]
+        self.top_points = pnt[keep]
+        self.numcase += num
+    def run(self, chunks):
+        for chunk in chunks:
+            if isinstance(chunk, tuple):
+                ids, loads = chunk
+            else:
+                ids, loads = None, chunk
+            self.update(loads, ids=ids)
+        return self
+    @property
+    def top_members(self):
+        return self.response.member[self.top_points]
+    def __str__(self):
+        lctyp = 'Ultimate'
+        if self.limit:
+            lctyp = 'Limit'
+        label = self.response.label
+        if label is None:
+            head = f'Load Case Envelope ({lctyp:s})'
+        else:
+            head = f'Load Case Envelope of {label:s} ({lctyp:s})'
+        mdstr = str(MDHeading(head, 3))
+        table = MDTable()
+        table.add_column('Load Case', 's')
+        table.add_column('Member', 's')
+        table.add_column(f'F<sub>x</sub> ({config.funit:s})', '.1f')
+        table.add_column(f'M<sub>y</sub> ({config.funit:s}.{config.lunit:s})', '.1f')
+        table.add_column(f'M<sub>z</sub> ({config.funit:s}.{config.lunit:s})', '.1f')
+        table.add_column(f'y ({config.lunit:s})', config.l1frm)
+        table.add_column(f'z ({config.lunit:s})', config.l1frm)
+        if config.msmode:
+            table.add_column('MS', '.2f')
+        else:
+            table.add_column('RF', '.2f')
+        for i in range(self.top_results.size):
+            pnt = self.top_points[i]
+            label = self.response.labels[self.response.member[pnt]]
+            if label is None:
+                label = str(self.response.member[pnt])
+            resi = float(self.top_results[i])
+            if isfinite(resi):
+                resi = floor(resi*100)/100
+            if config.msmode:
+                resi = resi-1.0
+            table.add_row([str(self.top_ids[i]), label, *self.top_loads[i],
+                           self.response.y[pnt], self.response.z[pnt], resi])
+        mdstr += str(table)
+        return mdstr
+    def _repr_markdown_(self):
+        return self.__str__()
+
+def array_chunks(loads: ndarray, chunksize: int=65536):
+    for i in range(0, loads.shape[0], chunksize):
+        yield arange(i, min(i+chunksize, loads.shape[0])), loads[i:i+chunksize]
+
+def npy_chunks(filepath: str, chunksize: int=65536):
+    loads = load(filepath, mmap_mode='r')
+    for i in range(0, loads.shape[0], chunksize):
+        yield arange(i, min(i+chunksize, loads.shape[0])), asarray(loads[i:i+chunksize], dtype=float)
+
+def csv_chunks(filepath: str, chunksize: int=65536, delimiter: str=','):
+    # Rows are either Fx, My, Mz or an id followed by Fx, My, Mz.
+    with open(filepath, 'r', newline='') as csvfile:
+        ids, loads = [], []
+        count = 0
+        for row in reader(csvfile, delimiter=delimiter):
+            if len(row) == 0:
+                continue
+            try:
+                values = [float(v) for v in row[-3:]]
+            except ValueError:
+                continue
+            if len(row) > 3:
+                ids.append(row[0].strip())
+            else:
+                ids.append(count)
+            loads.append(values)
+            count += 1
+            if len(loads) == chunksize:
+                yield ids, asarray(loads)
+                ids, loads = [], []
+        if len(loads) > 0:
+            yield ids, asarray(loads)
+
+def envelope(section, source, limit: bool=False, topk: int=10,
+             critical: bool=False, chunksize: int=65536):
+    env = Envelope(section, limit=limit, topk=topk, critical=critical)
+    if isinstance(source, str):
+        if source.endswith('.npy'):
+            chunks = npy_chunks(source, chunksize=chunksize)
+        else:
+            chunks = csv_chunks(source, chunksize=chunksize)
+    elif isinstance(source, ndarray):
+        chunks = array_chunks(source, chunksize=chunksize)
+    else:
+        chunks = source
+    return env.run(chunks)
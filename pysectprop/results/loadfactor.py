@@ -0,0 +1,26 @@
+from typing import NamedTuple
+from numpy import arange, ndarray
+from .loadresponse import LoadResponse
+
+class LoadFactors(NamedTuple):
+    factor: ndarray
+    point: ndarray
+    member: ndarray
+    y: ndarray
+    z: ndarray
+    sigma: ndarray
+    allowed: ndarray
+
+def load_factors(section, directions, limit: bool=False, critical: bool=False):
+    # Stress is linear in load, so the allowable multiplier of each
+    # direction is its smallest reserve factor over all points.
+    if isinstance(section, LoadResponse):
+        response = section
+    else:
+        response = section.load_response(critical=critical)
+    _, sigma, allowed, result = response.evaluate(directions, limit=limit)
+    pnt = result.argmin(axis=1)
+    ind = arange(pnt.size)
+    return LoadFactors(result[ind, pnt], response.index[pnt],
+                       response.member[pnt], response.y[pnt], response.z[pnt],
+                       sigma[ind, pnt], allowed[ind, pnt])
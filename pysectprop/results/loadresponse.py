@@ -0,0 +1,110 @@
+from numpy import arange, asarray, atleast_2d, concatenate, cumsum, full, nan
+from .sectionresult import reserve_factors, strain_coefficients
+
+def material_value(material, name: str):
+    value = getattr(material, name)
+    if value is None:
+        return nan
+    return value
+
+class LoadResponse(object):
+    label: str = None
+    EA: float = None
+    EIyy: float = None
+    EIzz: float = None
+    EIyz: float = None
+    cy: float = None
+    cz: float = None
+    labels: list = None
+    critical: bool = None
+    member = None
+    index = None
+    offsets = None
+    y = None
+    z = None
+    coef = None
+    E = None
+    Fty = None
+    Fcy = None
+    Ftu = None
+    Fcu = None
+    def __init__(self, section, critical: bool=False):
+        # Accepts a MaterialSection or a CompositeSection of them.
+        self.critical = critical
+        members = getattr(section, 'sections', None)
+        if members is None:
+            members = [section]
+        self.label = section.label
+        self.EA = section.EA
+        self.EIyy = section.EIyy
+        self.EIzz = section.EIzz
+        self.EIyz = section.EIyz
+        self.cy = section.cy
+        self.cz = section.cz
+        self.labels = [member.label for member in members]
+        y, z, ind, pind = [], [], [], []
+        E, Fty, Fcy, Ftu, Fcu = [], [], [], [], []
+        for i, member in enumerate(members):
+            pnts = member.pnts
+            if critical:
+                hull = member.hull
+                pnts = [pnts[j] for j in hull]
+                pind.append(asarray(hull, dtype=int))
+            else:
+                pind.append(arange(len(pnts)))
+            num = len(pnts)
+            y.append(asarray([pnt.y for pnt in pnts], dtype=float))
+            z.append(asarray([pnt.z for pnt in pnts], dtype=float))
+            ind.append(full(num, i))
+            material = member.material
+            E.append(full(num, material.E))
+            Fty.append(full(num, material_value(material, 'Fty')))
+            Fcy.append(full(num, material_value(material, 'Fcy')))
+            Ftu.append(full(num, material_value(material, 'Ftu')))
+            Fcu.append(full(num, material_value(material, 'Fcu')))
+        self.y = concatenate(y)
+        self.z = concatenate(z)
+        self.member = concatenate(ind)
+        self.index = concatenate(pind)
+        self.offsets = concatenate(([0], cumsum([arr.size for arr in ind])))
+        self.E = concatenate(E)
+        self.Fty = concatenate(Fty)
+        self.Fcy = concatenate(Fcy)
+        self.Ftu = concatenate(Ftu)
+        self.Fcu = concatenate(Fcu)
+        self.coef = strain_coefficients(self.EA, self.EIyy, self.EIzz, self.EIyz,
+                                        self.yna, self.zna)
+    @property
+    def yna(self):
+        return self.y-self.cy
+    @property
+    def zna(self):
+        return self.z-self.cz
+    @property
+    def numpnt(self):
+        return self.y.size
+    def allowables(self, limit: bool=False):
+        if limit:
+            return self.Fty, -self.Fcy
+        else:
+            return self.Ftu, -self.Fcu
+    def strain(self, loads):
+        return atleast_2d(asarray(loads, dtype=float))@self.coef
+    def stress(self, loads):
+        return self.strain(loads)*self.E
+    def evaluate(self, loads, limit: bool=False):
+        eps = self.strain(loads)
+        sigma = eps*self.E
+        tensall, compall = self.allowables(limit)
+        allowed, result = reserve_factors(sigma, tensall, compall)
+        return eps, sigma, allowed, result
+    def reserve_factors(self, loads, limit: bool=False):
+        return self.evaluate(loads, limit=limit)[3]
+    def member_slice(self, ind: int):
+        return slice(int(self.offsets[ind]), int(self.offsets[ind+1]))
+    def __repr__(self):
+        if self.label is None:
+            outstr = '<LoadResponse>'
+        else:
+            outstr = f'<LoadResponse {self.label:s}>'
+        return outstr
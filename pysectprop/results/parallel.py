@@ -0,0 +1,85 @@
+from multiprocessing import Pool, cpu_count
+from multiprocessing.shared_memory import SharedMemory
+from numpy import asarray, atleast_2d, empty, float64, ndarray
+from .loadresponse import LoadResponse
+from .sectionresult import reserve_factors
+
+# Views onto the shared blocks, attached once per worker by the initializer.
+worker_data = {}
+
+def shared_array(shape: tuple):
+    size = 8
+    for num in shape:
+        size *= num
+    shm = SharedMemory(create=True, size=max(size, 8))
+    return shm, ndarray(shape, dtype=float64, buffer=shm.buf)
+
+def init_worker(specs: dict):
+    for key, (name, shape) in specs.items():
+        shm = SharedMemory(name=name)
+        worker_data[key] = ndarray(shape, dtype=float64, buffer=shm.buf)
+        worker_data[f'shm_{key:s}'] = shm
+
+def run_chunk(bounds: tuple):
+    start, stop = bounds
+    loads = worker_data['loads'][start:stop]
+    sigma = (loads@worker_data['coef'])*worker_data['E']
+    _, result = reserve_factors(sigma, worker_data['tensall'], worker_data['compall'])
+    worker_data['result'][start:stop] = result
+    return start
+
+def parallel_reserve_factors(section, loads, limit: bool=False, critical: bool=False,
+                             processes: int=None, chunksize: int=4096):
+    if isinstance(section, LoadResponse):
+        response = section
+    else:
+        response = section.load_response(critical=critical)
+    loads = atleast_2d(asarray(loads, dtype=float))
+    numcase = loads.shape[0]
+    tensall, compall = response.allowables(limit)
+    inputs = {
+        'loads': loads,
+        'coef': response.coef,
+        'E': response.E,
+        'tensall': tensall,
+        'compall': compall,
+    }
+    chunks = [(i, min(i+chunksize, numcase)) for i in range(0, numcase, chunksize)]
+    if processes is None:
+        processes = cpu_count()
+    processes = max(min(processes, len(chunks)), 1)
+    if processes == 1:
+        worker_data.clear()
+        worker_data.update(inputs)
+        worker_data['result'] = empty((numcase, response.numpnt))
+        for bounds in chunks:
+            run_chunk(bounds)
+        result = worker_data['result']
+        worker_data.clear()
+        return result
+    blocks = []
+    views = {}
+    specs = {}
+    inputs['result'] = None
+    try:
+        for key, value in inputs.items():
+            if value is None:
+                shape = (numcase, response.numpnt)
+            else:
+                shape = value.shape
+            shm, views[key] = shared_array(shape)
+            blocks.append(shm)
+            if value is not None:
+                views[key][...] = value
+            specs[key] = (shm.name, shape)
+        with Pool(processes, initializer=init_worker, initargs=(specs, )) as pool:
+            for _ in pool.imap_unordered(run_chunk, chunks):
+                pass
+        result = views['result'].copy()
+    finally:
+        # Views must be released before the blocks can be closed.
+        views.clear()
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+    return result
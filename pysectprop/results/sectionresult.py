@@ -1,7 +1,11 @@
-from math import floor
+from importlib import import_module
+from math import floor, isfinite
+from numpy import asarray, empty, errstate, inf, isnan, savez, where
 from py2md.classes import MDHeading, MDTable
 from .. import config
 
+columns = ('y', 'z', 'yna', 'zna', 'eps', 'sigma', 'allowed', 'result')
+
 class SectionResult(object):
     loadcase: str = None
     limit: bool = None
@@ -32,49 +36,31 @@ class SectionResult(object):
         self.Fx = Fx
         self.My = My
         self.Mz = Mz
-        if limit:
-            tensall = self.materialsection.material.Fty
-            compall = -self.materialsection.material.Fcy
-        else:
-            tensall = self.materialsection.material.Ftu
-            compall = -self.materialsection.material.Fcu
-        E = self.materialsection.material.E
-        EA = self.totalsection.EA
-        EIyy = self.totalsection.EIyy
-        EIzz = self.totalsection.EIzz
-        EIyz = self.totalsection.EIyz
-        cy = self.totalsection.cy
-        cz = self.totalsection.cz
-        kd = EIyy*EIzz-EIyz**2
-        ky = (Mz*EIyy-My*EIyz)/kd
-        kz = (My*EIzz-Mz*EIyz)/kd
-        self.y, self.z = [], []
-        self.yna, self.zna = [], []
-        self.eps = []
-        self.allowed = []
-        self.sigma = []
-        self.result = []
-        for point in self.materialsection.pnts:
-            self.y.append(point.y)
-            self.z.append(point.z)
-            yna = point.y-cy
-            zna = point.z-cz
-            self.yna.append(yna)
-            self.zna.append(zna)
-            eps = Fx/EA+ky*yna+kz*zna
-            self.eps.append(eps)
-            sigma = eps*E
-            self.sigma.append(sigma)
-            allowed = tensall
-            result = float('inf')
-            if sigma < 0.0:
-                allowed = compall
-                result = allowed/sigma
-            elif sigma > 0.0:
-                allowed = tensall
-                result = allowed/sigma
-            self.allowed.append(allowed)
-            self.result.append(result)
+        tensall, compall = material_allowables(self.materialsection.material, limit)
+        pnts = self.materialsection.pnts
+        self.y = asarray([pnt.y for pnt in pnts], dtype=float)
+        self.z = asarray([pnt.z for pnt in pnts], dtype=float)
+        self.yna = self.y-self.totalsection.cy
+        self.zna = self.z-self.totalsection.cz
+        coef = strain_coefficients(self.totalsection.EA, self.totalsection.EIyy,
+                                   self.totalsection.EIzz, self.totalsection.EIyz,
+                                   self.yna, self.zna)
+        self.eps = asarray([Fx, My, Mz], dtype=float)@coef
+        self.sigma = self.eps*self.materialsection.material.E
+        self.allowed, self.result = reserve_factors(self.sigma, tensall, compall)
+    def to_numpy(self):
+        return {column: getattr(self, column) for column in columns}
+    def to_arrow(self):
+        pyarrow = optional_module('pyarrow', 'arrow')
+        return pyarrow.table(self.to_numpy())
+    def to_pandas(self):
+        pandas = optional_module('pandas', 'pandas')
+        return pandas.DataFrame(self.to_numpy())
+    def write_npz(self, filepath: str):
+        savez(filepath, **self.to_numpy())
+    def write_parquet(self, filepath: str):
+        parquet = optional_module('pyarrow.parquet', 'arrow')
+        parquet.write_table(self.to_arrow(), filepath)
     def __str__(self):
         lctyp = 'Ultimate'
         if self.limit:
@@ -95,8 +81,9 @@ class SectionResult(object):
             table.add_column('MS', '.2f')
         else:
             table.add_column('RF', '.2f')
-        for i, resi in enumerate(self.result):
-            resi = floor(resi*100)/100
+        for i, resi in enumerate(self.result.tolist()):
+            if isfinite(resi):
+                resi = floor(resi*100)/100
             if config.msmode:
                 resi = resi-1.0
             table.add_row([self.y[i], self.z[i], self.yna[i], self.zna[i],
@@ -105,3 +92,31 @@ class SectionResult(object):
         return mdstr
     def _repr_markdown_(self):
         return self.__str__()
+
+def optional_module(name: str, extra: str):
+    try:
+        return import_module(name)
+    except ImportError as err:
+        raise ImportError(f'{name:s} is required for this export, install it with pip install pysectprop[{extra:s}].') from err
+
+def material_allowables(material, limit: bool=False):
+    if limit:
+        return material.Fty, -material.Fcy
+    else:
+        return material.Ftu, -material.Fcu
+
+def strain_coefficients(EA: float, EIyy: float, EIzz: float, EIyz: float, yna, zna):
+    # Rows map Fx, My and Mz to the strain at each point.
+    kd = EIyy*EIzz-EIyz**2
+    coef = empty((3, yna.size))
+    coef[0] = 1.0/EA
+    coef[1] = (EIzz*zna-EIyz*yna)/kd
+    coef[2] = (EIyy*yna-EIyz*zna)/kd
+    return coef
+
+def reserve_factors(sigma, tensall, compall):
+    allowed = where(sigma < 0.0, compall, tensall)
+    # A point without an allowable (NaN) can never be the critical one.
+    with errstate(divide='ignore', invalid='ignore'):
+        result = where((sigma != 0.0) & ~isnan(allowed), allowed/sigma, inf)
+    return allowed, result
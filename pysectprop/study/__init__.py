@@ -0,0 +1,3 @@
+from .sweep import sweep
+from .catalog import SectionCatalog
+from .cripplingstudy import crippling_study
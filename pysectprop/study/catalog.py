@@ -0,0 +1,122 @@
+from numpy import arange, argpartition, argsort, asarray, concatenate, full, int64, isfinite, ones, searchsorted, zeros
+from .sweep import builder_parameters, sweep, sweep_bounds
+from ..general.sectionproperties import SectionProperties
+
+indexed = ('A', 'Iyy', 'Izz', 'width', 'height')
+
+class SectionCatalog(object):
+    builders: list = None
+    params: list = None
+    columns: dict = None
+    order: dict = None
+    values: dict = None
+    def __init__(self):
+        self.builders = []
+        self.params = []
+        self.columns = {}
+        self.order = {}
+        self.values = {}
+    def add(self, builder, grid: bool=True, **kwargs):
+        table = sweep(builder, grid=grid, **kwargs).ravel()
+        names = list(builder_parameters(builder))
+        ymin, ymax, zmin, zmax = sweep_bounds(builder, {name: table[name] for name in names})
+        valid = isfinite(table['A']) & (table['A'] > 0.0)
+        num = int(valid.sum())
+        fam = len(self.builders)
+        self.builders.append(builder)
+        self.params.append({name: table[name][valid] for name in names})
+        cols = {'family': full(num, fam, dtype=int64), 'row': arange(num, dtype=int64)}
+        for field in SectionProperties._fields:
+            cols[field] = table[field][valid]
+        cols['ymin'] = ymin[valid]
+        cols['ymax'] = ymax[valid]
+        cols['zmin'] = zmin[valid]
+        cols['zmax'] = zmax[valid]
+        cols['width'] = cols['ymax']-cols['ymin']
+        cols['height'] = cols['zmax']-cols['zmin']
+        for name, value in cols.items():
+            if name in self.columns:
+                self.columns[name] = concatenate((self.columns[name], value))
+            else:
+                self.columns[name] = value
+        self.build_indexes()
+        return num
+    def build_indexes(self):
+        for name in indexed:
+            order = argsort(self.columns[name], kind='stable')
+            self.order[name] = order
+            self.values[name] = self.columns[name][order]
+    def index_range(self, name: str, lower: float=None, upper: float=None):
+        values = self.values[name]
+        i = 0 if lower is None else searchsorted(values, lower, side='left')
+        j = values.size if upper is None else searchsorted(values, upper, side='right')
+        return i, j
+    def query(self, builders: tuple=None, **ranges):
+        # Seed with the narrowest sorted index, then filter on the rest.
+        seed = None
+        for name, (lower, upper) in ranges.items():
+            if name in self.order:
+                i, j = self.index_range(name, lower, upper)
+                if seed is None or j-i < seed[2]-seed[1]:
+                    seed = (name, i, j)
+        if seed is None:
+            idx = arange(len(self))
+        else:
+            name, i, j = seed
+            idx = self.order[name][i:j]
+        chk = ones(idx.size, dtype=bool)
+        for name, (lower, upper) in ranges.items():
+            if seed is not None and name == seed[0]:
+                continue
+            values = self.columns[name][idx]
+            if lower is not None:
+                chk &= values >= lower
+            if upper is not None:
+                chk &= values <= upper
+        if builders is not None:
+            if not isinstance(builders, (tuple, list)):
+                builders = (builders, )
+            # A builder added in several batches owns several families.
+            fams = [i for i, builder in enumerate(self.builders) if builder in builders]
+            famchk = zeros(len(self.builders), dtype=bool)
+            famchk[fams] = True
+            chk &= famchk[self.columns['family'][idx]]
+        idx = idx[chk]
+        return idx[argsort(self.columns['A'][idx], kind='stable')]
+    def lightest(self, builders: tuple=None, **ranges):
+        idx = self.query(builders=builders, **ranges)
+        if idx.size == 0:
+            return None
+        return self.entry(idx[0])
+    def nearest(self, k: int=1, builders: tuple=None, **targets):
+        if builders is None:
+            idx = arange(len(self))
+        else:
+            idx = self.query(builders=builders)
+        dist = zeros(idx.size)
+        for name, target in targets.items():
+            scale = abs(target) if target != 0.0 else 1.0
+            dist += ((self.columns[name][idx]-target)/scale)**2
+        k = min(k, idx.size)
+        if k < idx.size:
+            part = argpartition(dist, k-1)[:k]
+        else:
+            part = arange(idx.size)
+        part = part[argsort(dist[part], kind='stable')]
+        return idx[part]
+    def entry(self, ind: int):
+        fam = self.columns['family'][ind]
+        row = self.columns['row'][ind]
+        params = {name: float(value[row]) for name, value in self.params[fam].items()}
+        return self.builders[fam], params
+    def entries(self, idx):
+        return [self.entry(ind) for ind in asarray(idx)]
+    def build(self, ind: int, label: str=None):
+        builder, params = self.entry(ind)
+        return builder(**params, label=label)
+    def __len__(self):
+        if 'A' not in self.columns:
+            return 0
+        return self.columns['A'].size
+    def __repr__(self):
+        return f'<SectionCatalog {len(self):d} sections>'
@@ -0,0 +1,69 @@
+from multiprocessing import Pool, cpu_count
+from numpy import arange, asarray, empty, newaxis
+from ..general.crippling import crippling_allowables
+
+# Read-only inputs set once per worker by the pool initializer.
+worker_data = {}
+
+def init_worker(walls: list, Ec, Fcy, coef, cnef):
+    worker_data['walls'] = walls
+    worker_data['Ec'] = asarray(Ec, dtype=float)[:, newaxis]
+    worker_data['Fcy'] = asarray(Fcy, dtype=float)[:, newaxis]
+    worker_data['coef'] = asarray(coef, dtype=float)[newaxis, :]
+    worker_data['cnef'] = asarray(cnef, dtype=float)[newaxis, :]
+
+def run_chunk(bounds: tuple):
+    start, stop = bounds
+    Ec, Fcy = worker_data['Ec'], worker_data['Fcy']
+    coef, cnef = worker_data['coef'], worker_data['cnef']
+    Fcc = empty((stop-start, Ec.shape[0], coef.shape[1]))
+    Pcc = empty((stop-start, Ec.shape[0], coef.shape[1]))
+    for i in range(start, stop):
+        result = crippling_allowables(worker_data['walls'][i], Ec, Fcy, coef, cnef)
+        Fcc[i-start] = result.Fcc_sec
+        Pcc[i-start] = result.Pcc_sec
+    return start, Fcc, Pcc
+
+def crippling_study(sections: list, materials: list, coef, cnef,
+                    processes: int=None, chunksize: int=None):
+    walls = [section.walls for section in sections]
+    Ec = [material.Ec for material in materials]
+    Fcy = [material.Fcy for material in materials]
+    coef = asarray(coef, dtype=float).ravel()
+    cnef = asarray(cnef, dtype=float).ravel()
+    numsec = len(walls)
+    nummat = len(Ec)
+    numcef = coef.size
+    if processes is None:
+        processes = cpu_count()
+    processes = max(min(processes, numsec), 1)
+    if chunksize is None:
+        chunksize = max(numsec//(4*processes), 1)
+    chunks = [(i, min(i+chunksize, numsec)) for i in range(0, numsec, chunksize)]
+    Fcc = empty((numsec, nummat, numcef))
+    Pcc = empty((numsec, nummat, numcef))
+    initargs = (walls, Ec, Fcy, coef, cnef)
+    if processes == 1:
+        init_worker(*initargs)
+        try:
+            for bounds in chunks:
+                start, Fccc, Pccc = run_chunk(bounds)
+                Fcc[start:start+Fccc.shape[0]] = Fccc
+                Pcc[start:start+Pccc.shape[0]] = Pccc
+        finally:
+            worker_data.clear()
+    else:
+        with Pool(processes, initializer=init_worker, initargs=initargs) as pool:
+            for start, Fccc, Pccc in pool.imap_unordered(run_chunk, chunks):
+                Fcc[start:start+Fccc.shape[0]] = Fccc
+                Pcc[start:start+Pccc.shape[0]] = Pccc
+    fields = [('section', int), ('material', int), ('coef', float),
+              ('cnef', float), ('Fcc', float), ('Pcc', float)]
+    table = empty((numsec, nummat, numcef), dtype=fields)
+    table['section'] = arange(numsec)[:, newaxis, newaxis]
+    table['material'] = arange(nummat)[newaxis, :, newaxis]
+    table['coef'] = coef[newaxis, newaxis, :]
+    table['cnef'] = cnef[newaxis, newaxis, :]
+    table['Fcc'] = Fcc
+    table['Pcc'] = Pcc
+    return table.ravel()
@@ -0,0 +1,121 @@
+from inspect import signature, Parameter
+from numpy import asarray, broadcast_arrays, empty, full, meshgrid, nan, ones, stack, where
+from ..extruded import LSection, ISection, ZSection, JSection, SSection, OmegaSection
+from ..formed import CSection, LSection as FormedLSection
+from ..general.generalsection import outline_moments
+from ..general.sectionproperties import SectionProperties, derived_moments_array
+
+def double_lip(values: dict):
+    return (values['tl1'] != 0.0) & (values['tl2'] != 0.0)
+
+def single_lip(values: dict):
+    return (values['tl1'] != 0.0) & (values['tl2'] == 0.0)
+
+def no_lip(values: dict):
+    return values['hl'] == 0.0
+
+def with_lip(values: dict):
+    return values['hl'] != 0.0
+
+# Each family maps to a list of (mask, outline) pairs, one per vertex layout.
+families = {
+    LSection: [(None, LSection.outline)],
+    ISection: [(None, ISection.outline)],
+    ZSection: [(None, ZSection.outline)],
+    JSection: [(None, JSection.outline)],
+    OmegaSection: [(None, OmegaSection.outline)],
+    SSection: [(double_lip, SSection.outline_double_lip),
+               (single_lip, SSection.outline_single_lip)],
+    CSection: [(None, CSection.outline)],
+    FormedLSection: [(no_lip, FormedLSection.outline),
+                     (with_lip, FormedLSection.outline_lipped)],
+}
+
+def builder_parameters(builder):
+    params = {}
+    for name, param in signature(builder.__init__).parameters.items():
+        if name in ('self', 'label'):
+            continue
+        if param.default is Parameter.empty:
+            params[name] = None
+        else:
+            params[name] = param.default
+    return params
+
+def sweep_parameters(builder, grid: bool=False, **kwargs):
+    params = builder_parameters(builder)
+    for name in kwargs:
+        if name not in params:
+            raise ValueError(f'{builder.__name__:s} has no parameter {name:s}.')
+    for name, default in params.items():
+        if name in kwargs:
+            params[name] = asarray(kwargs[name], dtype=float)
+        elif default is None:
+            raise ValueError(f'{builder.__name__:s} requires parameter {name:s}.')
+        else:
+            params[name] = asarray(default, dtype=float)
+    names = list(params)
+    if grid:
+        values = meshgrid(*[params[name].ravel() for name in names], indexing='ij')
+    else:
+        values = broadcast_arrays(*[params[name] for name in names])
+    return {name: value.ravel() if grid else value for name, value in zip(names, values)}
+
+def outline_arrays(outline, values: dict):
+    names = list(signature(outline).parameters)
+    y, z, r = outline(*[values[name] for name in names])
+    y = stack(broadcast_arrays(*y), axis=-1)
+    z = stack(broadcast_arrays(*z), axis=-1)
+    r = stack(broadcast_arrays(*r), axis=-1)
+    return y, z, r
+
+def family_outlines(builder, values: dict):
+    # Yields the rows each layout of a family covers with their outlines.
+    shape = next(iter(values.values())).shape
+    for mask, outline in families[builder]:
+        if mask is None:
+            chk = ones(shape, dtype=bool)
+        else:
+            chk = mask(values)
+        if not chk.any():
+            continue
+        y, z, r = outline_arrays(outline, {k: v[chk] for k, v in values.items()})
+        yield chk, y, z, r
+
+def sweep_moments(builder, values: dict):
+    shape = next(iter(values.values())).shape
+    moments = [full(shape, nan) for _ in range(6)]
+    for chk, y, z, r in family_outlines(builder, values):
+        result = outline_moments(y, z, r)
+        sgn = where(result[0] < 0.0, -1.0, 1.0)
+        for moment, value in zip(moments, result):
+            moment[chk] = sgn*value
+    return moments
+
+def sweep_bounds(builder, values: dict):
+    shape = next(iter(values.values())).shape
+    bounds = [full(shape, nan) for _ in range(4)]
+    for chk, y, z, _ in family_outlines(builder, values):
+        result = (y.min(axis=-1), y.max(axis=-1), z.min(axis=-1), z.max(axis=-1))
+        for bound, value in zip(bounds, result):
+            bound[chk] = value
+    return bounds
+
+def sweep(builder, grid: bool=False, chunksize: int=65536, **kwargs):
+    if builder not in families:
+        raise ValueError(f'{builder.__name__:s} is not a sweepable section family.')
+    values = sweep_parameters(builder, grid=grid, **kwargs)
+    names = list(values)
+    shape = values[names[0]].shape
+    fields = names+list(SectionProperties._fields)
+    result = empty(shape, dtype=[(field, float) for field in fields]).ravel()
+    flat = {name: value.ravel() for name, value in values.items()}
+    for name in names:
+        result[name] = flat[name]
+    num = result.size
+    for i in range(0, num, chunksize):
+        chunk = {name: value[i:i+chunksize] for name, value in flat.items()}
+        props = derived_moments_array(*sweep_moments(builder, chunk))
+        for field, value in zip(SectionProperties._fields, props):
+            result[field][i:i+chunksize] = value
+    return result.reshape(shape)
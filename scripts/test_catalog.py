@@ -0,0 +1,35 @@
+#%% Import Dependencies
+from numpy import linspace
+from pysectprop.extruded import ZSection, JSection
+from pysectprop.study import SectionCatalog
+
+#%% Build Catalog
+catalog = SectionCatalog()
+catalog.add(ZSection, hw=linspace(20.0, 60.0, 21), tw=[1.2, 1.6, 2.0],
+            wf1=linspace(10.0, 30.0, 11), tf1=[1.6, 2.0],
+            wf2=linspace(10.0, 30.0, 11), tf2=[1.6, 2.0], r1=1.0, r2=1.0)
+catalog.add(JSection, hw=linspace(20.0, 60.0, 21), tw=[1.6, 2.0],
+            wuf=linspace(10.0, 30.0, 6), tuf=[1.6, 2.0],
+            wlf=linspace(10.0, 30.0, 6), tlf=[1.6, 2.0], hl=5.0, tl=1.6)
+print(catalog)
+
+#%% Lightest Section Within Envelope
+builder, params = catalog.lightest(Iyy=(20000.0, None), Izz=(3000.0, None),
+                                   height=(None, 45.0), width=(None, 35.0))
+print(builder.__name__, params)
+
+section = builder(**params)
+print(section.A, section.Iyy, section.Izz)
+
+#%% Nearest Sections
+for builder, params in catalog.entries(catalog.nearest(3, A=150.0, Iyy=30000.0)):
+    print(builder.__name__, params)
+
+#%% Builder Added In Two Batches
+twice = SectionCatalog()
+twice.add(ZSection, hw=[30.0, 40.0], tw=1.6, wf1=20.0, tf1=1.6, wf2=20.0, tf2=1.6)
+twice.add(ZSection, hw=[50.0, 60.0], tw=1.6, wf1=20.0, tf1=1.6, wf2=20.0, tf2=1.6)
+twice.add(JSection, hw=45.0, tw=1.6, wuf=20.0, tuf=1.6, wlf=20.0, tlf=1.6)
+print(len(twice), twice.query(builders=ZSection).size)
+for builder, params in twice.entries(twice.nearest(4, builders=ZSection, A=150.0)):
+    print(builder.__name__, params['hw'])
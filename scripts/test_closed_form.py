@@ -0,0 +1,37 @@
+#%% Import Dependencies
+from pysectprop.extruded import RectangleSection, CircleSection, TubeSection, SemiTubeSection
+
+#%% Create Sections
+sections = [
+    RectangleSection(17.6, 1.6),
+    RectangleSection(20.0, 10.0, 2.0),
+    CircleSection(10.0),
+    TubeSection(80.0, 74.0),
+    SemiTubeSection(30.0, 20.0)
+]
+
+#%% Cross Check Closed Form Against General Path
+for section in sections:
+    closed = (section.A, section.Ay, section.Az, section.Ayy, section.Azz, section.Ayz)
+    general = section.contour_moments()
+    diff = max(abs(c-g) for c, g in zip(closed, general))
+    print(f'{section!r:s} max difference = {diff:.3e}')
+
+#%% Transformed Section Falls Back to General Path
+tube = TubeSection(80.0, 74.0)
+tube.translate(10.0, 5.0)
+tube.reset()
+print(tube.transformed, tube.A, tube.cy, tube.cz)
+
+#%% Primitive Contours Skip Cleanup And Reorientation
+# The outer contour must run counter-clockwise and holes clockwise without
+# duplicate points, as the general constructor would have left them.
+from pysectprop.general.generalsection import cleanup_points
+from pysectprop.general.polygon import polygon_moments
+sections += [TubeSection(20.0, 0.0), SemiTubeSection(20.0, 0.0)]
+for section in sections:
+    signs = [bool(polygon_moments(cy, cz)[0] > 0.0) for cy, cz, _ in section.contours]
+    clean = all(len(cleanup_points(*contour)[0]) == len(contour[0]) for contour in section.contours)
+    general = section.contour_moments()
+    diff = max(abs(c-g) for c, g in zip((section.A, section.Ay, section.Az), general))
+    print(f'{section!r:s} orientation = {signs}, clean = {clean}, difference = {diff:.3e}')
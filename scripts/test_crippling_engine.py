@@ -0,0 +1,45 @@
+#%% Import Dependencies
+from numpy import abs as npabs, asarray
+from pysectprop.general import CripplingSection, Material, ThinWalledSection
+from pysectprop.general import crippling_allowables, material_crippling
+
+#%% Create Materials
+alum = Material(71000.0, 72400.0, label='7075-T6')
+alum.Fcy = 490.0
+soft = Material(68000.0, 69000.0, label='6061-T6')
+soft.Fcy = 240.0
+
+#%% Create Section
+thin = ThinWalledSection([-30.0, -15.0, -10.0, 10.0, 15.0, 30.0],
+                         [0.0, 0.0, 25.0, 25.0, 0.0, 0.0], [1.6]*5, label='Hat')
+thin.check_area()
+crip = CripplingSection(thin, alum, 0.295, 0.295*1.6)
+print(crip)
+
+#%% Per-Segment Loop As In The Original Table
+def segment_crippling(section, material, coef, cnef):
+    Ec, Fcy = material.Ec, material.Fcy
+    Fcc = []
+    for seg in section.segs:
+        b, t = seg.ls, seg.ts
+        if seg.is_oef():
+            Fcc.append(min([(Ec*Fcy)**0.5*coef/(b/t)**0.75, Fcy]))
+        if seg.is_nef():
+            Fcc.append(min([(Ec*Fcy)**0.5*cnef/(b/2/t)**0.75, Fcy]))
+    return asarray(Fcc)
+
+#%% Vectorized Engine Against The Loop
+Fcc = segment_crippling(thin, alum, 0.295, 0.295*1.6)
+result = crippling_allowables(thin.walls, alum.Ec, alum.Fcy, 0.295, 0.295*1.6)
+print(npabs(result.Fcc-Fcc).max(), npabs(crip.crippling.Fcc-Fcc).max())
+print(crip.Fcc, (Fcc*result.Acc).sum()/result.Acc.sum())
+
+#%% Materials By Coefficient Pairs
+coef = [0.295, 0.316, 0.342]
+cnef = [0.472, 0.506, 0.547]
+result = material_crippling(thin.walls, [alum, soft], coef, cnef)
+print(result.Fcc_sec.shape, result.Fcc.shape)
+for i, material in enumerate((alum, soft)):
+    for j in range(len(coef)):
+        Fcc = segment_crippling(thin, material, coef[j], cnef[j])
+        print(material.label, coef[j], cnef[j], npabs(result.Fcc[i, j]-Fcc).max())
@@ -0,0 +1,43 @@
+#%% Import Dependencies
+from math import atan2, cos, sin
+from pysectprop.general import GeneralSection
+from pysectprop.general.arc import Arc
+from pysectprop.general.polygon import polygon_moments
+from pysectprop.extruded import ISection, OmegaSection, ZSection
+from pysectprop.formed import CSection
+
+#%% Reference Polygon Quadrature
+def reference_moments(section, num: int=2000):
+    y, z = [], []
+    for obj in section.path:
+        if isinstance(obj, Arc):
+            yf, zf = obj.pntf.y, obj.pntf.z
+            tha = atan2(obj.pnta.z-zf, obj.pnta.y-yf)
+            for i in range(num):
+                th = tha+obj.ang*i/num
+                y.append(yf+obj.radius*cos(th))
+                z.append(zf+obj.radius*sin(th))
+        else:
+            y.append(obj.pnta.y)
+            z.append(obj.pnta.z)
+    A, Ay, Az, Ayy, Azz, Ayz = polygon_moments(y, z)
+    cy, cz = Ay/A, Az/A
+    return A, Azz-A*cz**2, Ayy-A*cy**2, Ayz-A*cy*cz
+
+#%% Filleted Sections
+sections = [
+    ISection(100.0, 5.0, 50.0, 8.0, 40.0, 6.0, r1=6.0, r2=4.0),
+    ZSection(60.0, 2.0, 25.0, 2.5, 20.0, 2.5, r1=3.0, r2=2.0),
+    OmegaSection(30.0, 2.0, 20.0, 2.0, 15.0, 2.0, rf=3.0, rl=2.0),
+    CSection(50.0, 20.0, 20.0, 2.0, 3.0),
+    GeneralSection([10.0, 30.0, 30.0, 10.0], [5.0, 5.0, 25.0, 25.0], [4.0, 4.0, 4.0, 4.0]),
+]
+
+#%% Compare Moments
+for section in sections:
+    A, Iyy, Izz, Iyz = reference_moments(section)
+    print(type(section).__name__)
+    print(f'  A   {section.A:.6f} {A:.6f} {section.A-A:.2e}')
+    print(f'  Iyy {section.Iyy:.6f} {Iyy:.6f} {(section.Iyy-Iyy)/Iyy:.2e}')
+    print(f'  Izz {section.Izz:.6f} {Izz:.6f} {(section.Izz-Izz)/Izz:.2e}')
+    print(f'  Iyz {section.Iyz:.6f} {Iyz:.6f} {section.Iyz-Iyz:.2e}')
@@ -0,0 +1,52 @@
+#%% Import Dependencies
+from math import pi
+from pysectprop.general import GeneralSection
+
+#%% Plate With A Lightening Hole
+# The outer contour runs clockwise and the hole counter-clockwise, both are
+# reoriented when the section is built.
+w, h, rh = 100.0, 50.0, 10.0
+y = [0.0, 0.0, w, w]
+z = [0.0, h, h, 0.0]
+r = [0.0, 0.0, 0.0, 0.0]
+hole = ([w/2-rh, w/2+rh, w/2+rh, w/2-rh], [h/2-rh, h/2-rh, h/2+rh, h/2+rh], [rh]*4)
+plate = GeneralSection(y, z, r, label='Lightened Plate', holes=[hole])
+print(plate)
+
+#%% Closed Form Comparison
+A = w*h-pi*rh**2
+Iyy = w*h**3/12-pi*rh**4/4
+Izz = h*w**3/12-pi*rh**4/4
+print(plate.A, A)
+print(plate.Iyy, Iyy)
+print(plate.Izz, Izz)
+print(plate.cy, plate.cz, plate.Iyz)
+
+#%% Offset Filleted Hole
+slot = ([60.0, 90.0, 90.0, 60.0], [10.0, 10.0, 40.0, 40.0], [5.0]*4)
+plate2 = GeneralSection(y, z, r, label='Two Holes', holes=[hole, slot])
+solid = GeneralSection(*slot)
+print(plate2.A, A-solid.A)
+print(plate2.Ay, w*h*w/2-pi*rh**2*w/2-solid.Ay)
+
+#%% Transformed Holed Section
+plate2.mirror_z()
+plate2.translate(10.0, 5.0)
+print(plate2.cy, plate2.cz, plate2.Iyy, plate2.Izz)
+check = GeneralSection(plate2.y, plate2.z, plate2.r, holes=plate2.holes)
+print(check.cy, check.cz, check.Iyy, check.Izz)
+
+#%% Plot Holed Section
+ax = plate2.plot()
+
+#%% Composite Section With A Tube Member
+# Each contour starts its own sub-path so the bore is cut out of the tube.
+from matplotlib.path import Path
+from pysectprop.extruded import TubeSection
+from pysectprop import CompositeSection
+tube = TubeSection(20.0, 16.0, label='Tube')
+tube.translate(w/2, h/2)
+compsect = CompositeSection([plate, tube])
+ax = compsect.plot()
+codes = ax.collections[0].get_paths()[1].codes
+print(int((codes == Path.MOVETO).sum()))
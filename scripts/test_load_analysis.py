@@ -0,0 +1,88 @@
+#%% Import Dependencies
+from os.path import join
+from tempfile import TemporaryDirectory
+from numpy import abs as npabs, argsort, concatenate, load, save, savetxt
+from numpy.random import default_rng
+from pysectprop import CompositeSection, MaterialSection
+from pysectprop.extruded import LSection, RectangleSection
+from pysectprop.general import Material
+from pysectprop.results import envelope, load_factors, parallel_reserve_factors
+
+#%% Create Materials
+alum = Material(72000.0, 73000.0, label='Aluminium')
+alum.set_yield_strengths(345.0, 290.0)
+alum.set_ultimate_strengths(483.0, 420.0)
+steel = Material(196000.0, 200000.0, label='Steel')
+steel.set_yield_strengths(1000.0, 1030.0)
+steel.set_ultimate_strengths(1070.0, 1110.0)
+
+#%% Create Composite Section
+lsect = LSection(17.6, 1.6, 13.6, 1.6, 3.0, label='Angle')
+rsect = RectangleSection(17.6, 1.6, label='Strap')
+rsect.translate(-0.8, 17.6/2)
+compsect = CompositeSection([MaterialSection(lsect, alum), MaterialSection(rsect, steel)])
+
+#%% Relative Difference
+def difference(value, reference):
+    return (npabs(value-reference)/npabs(reference)).max()
+
+#%% Load Cases
+rng = default_rng(64)
+loads = rng.normal(size=(2000, 3))*[1500.0, 20000.0, 8000.0]
+loadcases = [f'LC{i+1:d}' for i in range(loads.shape[0])]
+
+#%% Reference Results From apply_load
+reference = []
+for loadcase, (Fx, My, Mz) in zip(loadcases, loads):
+    sectresults = compsect.apply_load(loadcase, Fx, My, Mz)
+    reference.append(concatenate([sectresult.result for sectresult in sectresults]))
+reference = concatenate([reference])
+governing = reference.min(axis=1)
+
+#%% Batched Results
+batchresults = compsect.apply_loads(loadcases, loads)
+result = concatenate([batchresult.result for batchresult in batchresults], axis=1)
+print('batch', difference(result, reference))
+print(batchresults[0].case_result(0))
+
+#%% Load Response Operator
+response = compsect.load_response()
+print('response', difference(response.reserve_factors(loads), reference))
+
+#%% Critical Points Only
+critical = compsect.load_response(critical=True)
+print('critical', critical.numpnt, response.numpnt)
+print('critical', difference(critical.reserve_factors(loads).min(axis=1), governing))
+
+#%% Streaming Envelope
+topk = 10
+top = argsort(governing, kind='stable')[:topk]
+with TemporaryDirectory() as tmpdir:
+    npyfile = join(tmpdir, 'loads.npy')
+    csvfile = join(tmpdir, 'loads.csv')
+    save(npyfile, loads)
+    savetxt(csvfile, loads, delimiter=',')
+    for source in (loads, npyfile, csvfile):
+        env = envelope(compsect, source, topk=topk, chunksize=256)
+        print('envelope', difference(env.result_min, reference.min(axis=0)),
+              difference(env.top_results, governing[top]))
+print(env)
+
+#%% Columnar Exports
+sectresult = compsect.apply_load(loadcases[0], *loads[0])[0]
+columns = sectresult.to_numpy()
+with TemporaryDirectory() as tmpdir:
+    npzfile = join(tmpdir, 'result.npz')
+    sectresult.write_npz(npzfile)
+    with load(npzfile) as data:
+        print('npz', max(npabs(data[name]-value).max() for name, value in columns.items()))
+
+#%% Parallel Reserve Factors
+result = parallel_reserve_factors(compsect, loads, processes=2, chunksize=256)
+print('parallel', difference(result, reference))
+
+#%% Allowable Load Factors
+lf = load_factors(compsect, loads[:5])
+for factor, (Fx, My, Mz) in zip(lf.factor, loads[:5]):
+    sectresults = compsect.apply_load('Factored', factor*Fx, factor*My, factor*Mz)
+    print('load factor', factor, min(sectresult.result.min() for sectresult in sectresults))
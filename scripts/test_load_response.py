@@ -0,0 +1,50 @@
+#%% Import Dependencies
+from numpy import isfinite, isinf, isnan
+from pysectprop import CompositeSection, MaterialSection
+from pysectprop.extruded import LSection, RectangleSection
+from pysectprop.general import Material
+from pysectprop.results import Envelope, load_factors, parallel_reserve_factors
+
+#%% Composite With An Ultimate Only Member
+# The aluminium has no yield strengths, so it has no limit allowables.
+def composite_section():
+    alum = Material(72000.0, 73000.0, label='Aluminium')
+    alum.set_ultimate_strengths(483.0, 420.0)
+    steel = Material(196000.0, 200000.0, label='Steel')
+    steel.set_yield_strengths(1000.0, 1030.0)
+    steel.set_ultimate_strengths(1070.0, 1110.0)
+    lsect = LSection(17.6, 1.6, 13.6, 1.6, 3.0, label='Angle')
+    rsect = RectangleSection(17.6, 1.6, label='Strap')
+    rsect.translate(-0.8, 17.6/2)
+    return CompositeSection([MaterialSection(lsect, alum), MaterialSection(rsect, steel)])
+
+loads = [[1500.0, 20000.0, 8000.0], [-1500.0, -20000.0, 8000.0], [0.0, 5000.0, -9000.0]]
+
+#%% Limit Results Skip Points Without An Allowable
+def test_limit_reserve_factors():
+    response = composite_section().load_response()
+    _, _, allowed, result = response.evaluate(loads, limit=True)
+    alum = response.member == 0
+    assert isnan(allowed[:, alum]).all()
+    assert isinf(result[:, alum]).all()
+    assert not isnan(result).any()
+
+#%% Critical Point Comes From The Member With Allowables
+def test_limit_critical_member():
+    compsect = composite_section()
+    factors = load_factors(compsect, loads, limit=True)
+    assert (factors.member == 1).all()
+    assert isfinite(factors.factor).all()
+    env = Envelope(compsect, limit=True).run([loads])
+    assert (env.top_members == 1).all()
+    assert not isnan(env.result_min).any()
+    result = parallel_reserve_factors(compsect, loads, limit=True, processes=1)
+    assert (result.argmin(axis=1) >= compsect.load_response().member_slice(1).start).all()
+
+#%% Ultimate Only Material On Its Own
+def test_ultimate_only_section():
+    alum = Material(72000.0, 73000.0, label='Aluminium')
+    alum.set_ultimate_strengths(483.0, 420.0)
+    msect = MaterialSection(LSection(17.6, 1.6, 13.6, 1.6, 3.0, label='Angle'), alum)
+    assert isinf(load_factors(msect, loads, limit=True).factor).all()
+    assert isfinite(load_factors(msect, loads).factor).all()
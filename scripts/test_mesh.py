@@ -0,0 +1,27 @@
+#%% Import Dependencies
+from pysectprop.general import GeneralSection
+
+#%% Slotted Block
+def slotted_block(width: float):
+    y = [0.0, 20.0, 20.0, 10.0+width/2, 10.0+width/2, 10.0-width/2, 10.0-width/2, 0.0]
+    z = [0.0, 0.0, 10.0, 10.0, 1.0, 1.0, 10.0, 10.0]
+    r = [0.0]*8
+    return GeneralSection(y, z, r, label=f'Slot {width:g}')
+
+#%% Narrow Slots Stay Open
+for width, size in ((0.02, None), (0.1, 1.0), (0.1, None), (0.5, None)):
+    block = slotted_block(width)
+    mesh = block.mesh(size)
+    props = block.torsion(size)
+    print(block.label, mesh.numelem, mesh.areas().min() > 0.0)
+    print(mesh.areas().sum(), block.A, props.J)
+
+#%% Plot Mesh
+from matplotlib.pyplot import figure
+
+block = slotted_block(0.1)
+mesh = block.mesh(1.0)
+fig = figure(figsize=(12, 8))
+ax = fig.gca()
+ax.set_aspect('equal')
+ax.triplot(mesh.nodes[:, 0], mesh.nodes[:, 1], mesh.elems, lw=0.5)
@@ -0,0 +1,26 @@
+#%% Import Dependencies
+from pysectprop import config
+from pysectprop.extruded import ZSection
+from pysectprop.general import property_cache
+
+#%% Build The Same Section Twice
+property_cache.clear()
+zsect1 = ZSection(60.0, 2.0, 25.0, 2.5, 20.0, 2.5, r1=3.0, r2=2.0)
+print(property_cache.info())
+zsect2 = ZSection(60.0, 2.0, 25.0, 2.5, 20.0, 2.5, r1=3.0, r2=2.0)
+print(property_cache.info())
+print(zsect1.fingerprint() == zsect2.fingerprint(), zsect1.compute() == zsect2.compute())
+
+#%% Different Geometry Misses
+zsect3 = ZSection(60.0, 2.0, 25.0, 2.5, 20.0, 2.5, r1=3.0, r2=2.5)
+print(property_cache.info())
+print(zsect3.fingerprint() in property_cache, zsect3.Iyy, zsect1.Iyy)
+
+#%% Resize Evicts The Oldest Records
+property_cache.resize(1)
+print(property_cache, zsect1.fingerprint() in property_cache, zsect3.fingerprint() in property_cache)
+property_cache.resize(0)
+zsect4 = ZSection(60.0, 2.0, 25.0, 2.5, 20.0, 2.5, r1=3.0, r2=2.0)
+print(property_cache, zsect4.Iyy)
+property_cache.resize(config.cachesize)
+print(property_cache)
@@ -0,0 +1,35 @@
+#%% Import Dependencies
+from os.path import join
+from tempfile import TemporaryDirectory
+from pysectprop.extruded import ISection, ZSection
+from pysectprop.general import CripplingSection, Material, PropertyStore, ThinWalledSection, property_cache
+
+#%% Create Sections
+zsect = ZSection(60.0, 2.0, 25.0, 2.5, 20.0, 2.5, r1=3.0, r2=2.0)
+isect = ISection(100.0, 5.0, 50.0, 8.0, 40.0, 6.0, r1=6.0, r2=4.0)
+thin = ThinWalledSection([25.0, 0.0, 0.0, 25.0], [60.0, 60.0, 0.0, 0.0], [2.5, 2.0, 2.5])
+thin.check_area()
+material = Material(71000.0, 72400.0, label='7075-T6')
+material.Fcy = 490.0
+crip = CripplingSection(thin, material, 0.295, 0.295*1.6)
+
+#%% Save And Load
+with TemporaryDirectory() as tmpdir:
+    filepath = join(tmpdir, 'sections.db')
+    with PropertyStore(filepath) as store:
+        store.save_many([zsect, isect, thin, crip])
+        print(store, len(store))
+        record = store.load(store.save(zsect))
+        print(record.kind, record.builder, record.params)
+        print(record.props == zsect.compute())
+        print(store.fetch(crip).crippling)
+
+    #%% Reopen And Preload The Cache
+    with PropertyStore(filepath) as store:
+        property_cache.clear()
+        print(len(store), store.preload(), property_cache.info())
+        print([record.builder for record in store.load_all(kind='general')])
+
+    #%% Version Or Schema Change Clears The Store
+    with PropertyStore(filepath, schema=store.schema+1) as store:
+        print(len(store))
@@ -0,0 +1,49 @@
+#%% Import Dependencies
+from importlib.util import find_spec
+from os.path import join
+from numpy import allclose
+from pytest import importorskip, raises, skip
+from pysectprop import MaterialSection
+from pysectprop.extruded import LSection
+from pysectprop.general import Material
+from pysectprop.results import SectionResult
+
+#%% Section Result
+def section_result():
+    alum = Material(72000.0, 73000.0, label='Aluminium')
+    alum.set_ultimate_strengths(483.0, 420.0)
+    lsect = LSection(17.6, 1.6, 13.6, 1.6, 3.0, label='Angle')
+    sectresult = SectionResult(MaterialSection(lsect, alum))
+    sectresult.set_load('LC1', 1500.0, 20000.0, 8000.0)
+    return sectresult
+
+#%% Pandas Export
+def test_to_pandas():
+    importorskip('pandas')
+    sectresult = section_result()
+    frame = sectresult.to_pandas()
+    assert list(frame.columns) == list(sectresult.to_numpy())
+    assert allclose(frame['result'].to_numpy(), sectresult.result)
+
+#%% Arrow And Parquet Export
+def test_to_arrow(tmp_path):
+    importorskip('pyarrow')
+    parquet = importorskip('pyarrow.parquet')
+    sectresult = section_result()
+    table = sectresult.to_arrow()
+    assert table.num_rows == sectresult.result.size
+    filepath = join(tmp_path, 'result.parquet')
+    sectresult.write_parquet(filepath)
+    assert allclose(parquet.read_table(filepath)['sigma'].to_numpy(), sectresult.sigma)
+
+#%% Missing Extras Name The Install Option
+def test_missing_extra():
+    sectresult = section_result()
+    if find_spec('pandas') is not None:
+        skip('pandas is installed')
+    with raises(ImportError, match=r'pysectprop\[pandas\]'):
+        sectresult.to_pandas()
+    if find_spec('pyarrow') is not None:
+        skip('pyarrow is installed')
+    with raises(ImportError, match=r'pysectprop\[arrow\]'):
+        sectresult.to_arrow()
@@ -0,0 +1,23 @@
+#%% Import Dependencies
+from numpy import linspace
+from pysectprop.extruded import LSection
+from pysectprop.formed import CSection
+from pysectprop.study import sweep
+
+#%% Sweep Extruded L-Section Family
+lprops = sweep(LSection, grid=True, hw=linspace(15.0, 30.0, 16), tw=[1.2, 1.6, 2.0],
+               wf=linspace(10.0, 20.0, 11), tf=[1.2, 1.6, 2.0], rc=3.0)
+
+print(lprops.shape)
+print(lprops[['hw', 'tw', 'wf', 'tf', 'A', 'Iyy', 'Izz']][:5])
+
+#%% Check Against Section Object
+lsect = LSection(17.6, 1.6, 13.6, 1.6, 3.0)
+lprop = sweep(LSection, hw=17.6, tw=1.6, wf=13.6, tf=1.6, rc=3.0)
+
+print(lsect.Iyy, lprop['Iyy'])
+
+#%% Sweep Formed C-Section Family
+cprops = sweep(CSection, hw=linspace(8.0, 16.0, 9), wuf=6.0, wlf=6.0, ts=1.4, rm=2.1)
+
+print(cprops[['hw', 'A', 'cy', 'Iyy', 'Izz']])
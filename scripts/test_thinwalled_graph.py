@@ -0,0 +1,24 @@
+#%% Import Dependencies
+from pysectprop.general import CripplingSection, Material, ThinWalledSection
+
+#%% Create Material
+material = Material(71000.0, 72400.0, label='7075-T6')
+material.Fcy = 490.0
+
+#%% Branched I Section
+hw, tw, wf, tf = 100.0, 2.0, 50.0, 3.0
+y = [0.0, 0.0, -wf/2, wf/2, -wf/2, wf/2]
+z = [0.0, hw, 0.0, 0.0, hw, hw]
+t = [tw, tf, tf, tf, tf]
+edges = [(0, 1), (0, 2), (0, 3), (1, 4), (1, 5)]
+isect = ThinWalledSection(y, z, t, label='I Section', edges=edges)
+isect.check_area()
+print(isect)
+print(isect.torsion())
+print(tf*wf**3*hw**2/24, (hw*tw**3+2*wf*tf**3)/3)
+
+ax = isect.plot()
+
+#%% Crippling of Branched I Section
+crip = CripplingSection(isect, material, 0.295, 0.295*1.6)
+print(crip)
@@ -0,0 +1,27 @@
+#%% Import Dependencies
+from numpy import abs as npabs, asarray
+from pysectprop.general import ThinWalledSection
+from pysectprop.general.thinwalledsection import wall_moments
+
+#%% Open And Closed Sections
+zsect = ThinWalledSection([25.0, 0.0, 0.0, -20.0], [60.0, 60.0, 0.0, 0.0], [2.5, 2.0, 2.5], label='Z')
+box = ThinWalledSection([0.0, 40.0, 40.0, 0.0], [0.0, 0.0, 60.0, 60.0], [1.6, 2.0, 1.6, 2.0], label='Box')
+hat = ThinWalledSection([-30.0, -15.0, -10.0, 10.0, 15.0, 30.0],
+                        [0.0, 0.0, 25.0, 25.0, 0.0, 0.0], [1.6]*5, label='Hat')
+
+#%% Wall Arrays Against Wall Segments
+for section in (zsect, box, hat):
+    section.check_area()
+    walls = section.walls
+    segs = section.segs
+    print(repr(section), walls.ts.size, len(segs))
+    for name in ('ya', 'za', 'yb', 'zb', 'ts', 'ls', 'th'):
+        values = asarray([getattr(seg, name) for seg in segs])
+        print(f'  {name:s} {npabs(getattr(walls, name)-values).max():.2e}')
+    oef = asarray([seg.is_oef() for seg in segs])
+    nef = asarray([seg.is_nef() for seg in segs])
+    print('  oef', ((walls.fa != walls.fb) == oef).all(), '  nef', (~(walls.fa | walls.fb) == nef).all())
+    moments = wall_moments(walls)
+    for name, value in zip(('A', 'Ay', 'Az', 'Ayy', 'Azz', 'Ayz'), moments):
+        total = sum(getattr(seg, name) for seg in segs)
+        print(f'  {name:s} {value:.6f} {total:.6f}')
@@ -0,0 +1,35 @@
+#%% Import Dependencies
+from math import pi
+from pysectprop.extruded import TubeSection
+from pysectprop.formed import CSection
+
+#%% Tube Section
+tube = TubeSection(10.0, 8.0)
+mesh = tube.mesh(0.1)
+print(mesh.numnode, mesh.numelem, mesh.areas().sum(), tube.A)
+
+props = tube.torsion(0.1)
+print(props)
+print(pi/32*(10.0**4-8.0**4))
+
+#%% Formed Channel Section
+chan = CSection(10.0, 4.0, 4.0, 0.1, 0.0)
+props = chan.torsion(0.02)
+print(props)
+
+h, b, t = 9.9, 3.95, 0.1
+e = 3*b**2/(6*b+h)
+print(t/2-e, (h+2*b)*t**3/3, t*b**3*h**2/12*(3*b+2*h)/(6*b+h))
+
+#%% Thin-Walled Channel Section
+from pysectprop.general import ThinWalledSection
+
+thin = ThinWalledSection([b, 0.0, 0.0, b], [h, h, 0.0, 0.0], [t, t, t])
+thin.check_area()
+print(thin.torsion())
+
+#%% Thin-Walled Box Section
+box = ThinWalledSection([0.0, 4.0, 4.0, 0.0], [0.0, 0.0, 6.0, 6.0], [0.1]*4)
+box.check_area()
+print(box.torsion())
+print(4*(4.0*6.0)**2/(2*(4.0+6.0)/0.1))
@@ -1,11 +1,15 @@
+import re
 import setuptools
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
+with open("pysectprop/__init__.py", "r") as fh:
+    version = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", fh.read(), re.M).group(1)
+
 setuptools.setup(
     name="pysectprop",
-    version="0.0.1",
+    version=version,
     author="Xero64",
     author_email="xero64@gmail.com",
     description="Python Section Property Calculator",
@@ -18,5 +22,9 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.8'
+    python_requires='>=3.8',
+    extras_require={
+        "pandas": ["pandas"],
+        "arrow": ["pyarrow"],
+    }
 )